@@ -0,0 +1,51 @@
+"""add_transaction_month_rollups
+
+Revision ID: 3f6a1c2d8b47
+Revises: 9ece02a5fa8c
+Create Date: 2026-10-18 00:00:00.000000+00:00
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f6a1c2d8b47"
+down_revision: str | None = "9ece02a5fa8c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "transaction_month_rollups",
+        sa.Column("ledger_id", sa.UUID(), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("month", sa.Integer(), nullable=False),
+        sa.Column("transaction_type", sa.String(20), nullable=False),
+        sa.Column("total_amount", sa.Numeric(15, 2), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["ledger_id"], ["ledgers.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("ledger_id", "year", "month", "transaction_type"),
+    )
+
+    # Backfill from existing transactions
+    op.execute(
+        """
+        INSERT INTO transaction_month_rollups
+            (ledger_id, year, month, transaction_type, total_amount)
+        SELECT
+            ledger_id,
+            EXTRACT(YEAR FROM date)::int,
+            EXTRACT(MONTH FROM date)::int,
+            transaction_type::text,
+            SUM(amount)
+        FROM transactions
+        WHERE transaction_type IS NOT NULL
+        GROUP BY 1, 2, 3, 4
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("transaction_month_rollups")
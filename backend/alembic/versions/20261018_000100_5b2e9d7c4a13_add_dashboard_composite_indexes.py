@@ -0,0 +1,51 @@
+"""add_dashboard_composite_indexes
+
+Revision ID: 5b2e9d7c4a13
+Revises: 3f6a1c2d8b47
+Create Date: 2026-10-18 00:01:00.000000+00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b2e9d7c4a13"
+down_revision: str | None = "3f6a1c2d8b47"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_transactions_from_account_date",
+        "transactions",
+        ["from_account_id", "date"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_transactions_to_account_date",
+        "transactions",
+        ["to_account_id", "date"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_transactions_ledger_type_date",
+        "transactions",
+        ["ledger_id", "transaction_type", "date"],
+        postgresql_include=["amount"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_accounts_ledger_type_archived",
+        "accounts",
+        ["ledger_id", "type", "is_archived", "sort_order", "name"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_accounts_ledger_type_archived", table_name="accounts")
+    op.drop_index("idx_transactions_ledger_type_date", table_name="transactions")
+    op.drop_index("idx_transactions_to_account_date", table_name="transactions")
+    op.drop_index("idx_transactions_from_account_date", table_name="transactions")
@@ -0,0 +1,54 @@
+"""add_account_current_balance
+
+Revision ID: 8d4f1b6e2c95
+Revises: 5b2e9d7c4a13
+Create Date: 2026-10-18 00:02:00.000000+00:00
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d4f1b6e2c95"
+down_revision: str | None = "5b2e9d7c4a13"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "accounts",
+        sa.Column("current_balance", sa.Numeric(15, 2), nullable=False, server_default="0"),
+    )
+
+    # Backfill each account's own signed balance from existing transactions
+    op.execute(
+        """
+        WITH incoming AS (
+            SELECT to_account_id AS account_id, SUM(amount) AS total
+            FROM transactions GROUP BY to_account_id
+        ),
+        outgoing AS (
+            SELECT from_account_id AS account_id, SUM(amount) AS total
+            FROM transactions GROUP BY from_account_id
+        )
+        UPDATE accounts SET current_balance = (
+            CASE accounts.type::text
+                WHEN 'ASSET' THEN COALESCE(incoming.total, 0) - COALESCE(outgoing.total, 0)
+                WHEN 'LIABILITY' THEN COALESCE(outgoing.total, 0) - COALESCE(incoming.total, 0)
+                WHEN 'INCOME' THEN COALESCE(outgoing.total, 0)
+                ELSE COALESCE(incoming.total, 0)
+            END
+        )
+        FROM accounts AS a
+        LEFT JOIN incoming ON incoming.account_id = a.id
+        LEFT JOIN outgoing ON outgoing.account_id = a.id
+        WHERE a.id = accounts.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("accounts", "current_balance")
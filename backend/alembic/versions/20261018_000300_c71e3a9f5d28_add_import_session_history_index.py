@@ -0,0 +1,29 @@
+"""add_import_session_history_index
+
+Revision ID: c71e3a9f5d28
+Revises: 8d4f1b6e2c95
+Create Date: 2026-10-18 00:03:00.000000+00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c71e3a9f5d28"
+down_revision: str | None = "8d4f1b6e2c95"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_import_sessions_ledger_created",
+        "import_sessions",
+        ["ledger_id", "created_at", "id"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_import_sessions_ledger_created", table_name="import_sessions")
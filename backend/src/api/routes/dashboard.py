@@ -8,7 +8,8 @@ import uuid
 from datetime import date
 from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from pydantic_core import to_json
 
 from src.api.deps import SessionDep
 from src.services.dashboard_service import DashboardService
@@ -16,20 +17,29 @@ from src.services.dashboard_service import DashboardService
 router = APIRouter(tags=["dashboard"])
 
 
+def _json_response(content: dict) -> Response:
+    """Serialize a dashboard payload directly to JSON.
+
+    pydantic-core writes dates and UUIDs natively, which skips the per-value
+    Python work of jsonable_encoder for these large read-only payloads.
+    """
+    return Response(content=to_json(content), media_type="application/json")
+
+
 @router.get("/ledgers/{ledger_id}/dashboard")
 def get_dashboard(
     ledger_id: uuid.UUID,
     session: SessionDep,
     start_date: date | None = None,
     end_date: date | None = None,
-) -> dict:
+) -> Response:
     """Get aggregated dashboard data for a ledger.
 
     Returns total assets, current month income/expenses, and 6-month trends.
     """
     service = DashboardService(session)
     try:
-        return service.get_dashboard_summary(ledger_id, start_date, end_date)
+        return _json_response(service.get_dashboard_summary(ledger_id, start_date, end_date))
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -41,7 +51,7 @@ def get_dashboard(
 def get_accounts_by_category(
     ledger_id: uuid.UUID,
     session: SessionDep,
-) -> dict:
+) -> Response:
     """Get all accounts grouped by category type.
 
     Returns accounts in fixed order: ASSET, LIABILITY, INCOME, EXPENSE.
@@ -49,7 +59,7 @@ def get_accounts_by_category(
     """
     service = DashboardService(session)
     try:
-        return service.get_accounts_by_category(ledger_id)
+        return _json_response(service.get_accounts_by_category(ledger_id))
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -63,14 +73,18 @@ def get_account_transactions(
     session: SessionDep,
     page: Annotated[int, Query(ge=1, description="Page number (1-indexed)")] = 1,
     page_size: Annotated[int, Query(ge=1, le=100, description="Items per page (max 100)")] = 50,
-) -> dict:
+    cursor: Annotated[
+        str | None, Query(description="next_cursor from the previous page; overrides page")
+    ] = None,
+) -> Response:
     """Get paginated transactions for an account.
 
     Returns transactions sorted by date (newest first) with pagination info.
+    Pass next_cursor back as cursor to fetch the following page without OFFSET.
     """
     service = DashboardService(session)
     try:
-        return service.get_account_transactions(account_id, page, page_size)
+        return _json_response(service.get_account_transactions(account_id, page, page_size, cursor))
     except ValueError as e:
         error_message = str(e)
         if "not found" in error_message.lower():
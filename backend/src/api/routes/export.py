@@ -3,8 +3,8 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import Response, StreamingResponse
-from sqlalchemy.orm import aliased, selectinload
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import aliased, contains_eager
 from sqlmodel import select
 
 from src.api.deps import SessionDep, get_current_user
@@ -57,9 +57,11 @@ def export_transactions(
         ToAccount, Transaction.to_account_id == ToAccount.id
     )
 
-    # Eager load for service
+    # Populate from_account/to_account from the joined rows, so the export
+    # reads account names without further queries
     query = query.options(
-        selectinload(Transaction.from_account), selectinload(Transaction.to_account)
+        contains_eager(Transaction.from_account.of_type(FromAccount)),
+        contains_eager(Transaction.to_account.of_type(ToAccount)),
     )
 
     # Filter by Date
@@ -111,10 +113,8 @@ def export_transactions(
             # We already fetched 'account' above if account_id is present
             acc_name = account.name  # type: ignore (checked above)
 
-        html_content = export_service.generate_html_content(transactions, date_range_str, acc_name)
-
-        return Response(
-            content=html_content,
+        return StreamingResponse(
+            export_service.generate_html_content(transactions, date_range_str, acc_name),
             media_type="text/html",
             headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
@@ -341,31 +341,68 @@ async def list_supported_banks(
 @router.get("/ledgers/{ledger_id}/import/history")
 async def get_import_history(
     ledger_id: uuid.UUID,
-    limit: int = 20,
-    offset: int = 0,
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: uuid.UUID | None = None,
     session: Session = Depends(get_session),
 ) -> Any:
     """
     Get import history for a ledger.
     Returns paginated list of import sessions ordered by creation date (newest first).
+
+    Pass the previous page's next_cursor (an import session ID) as cursor to
+    seek past it instead of using offset; cursor requests skip the total
+    count, which is only needed to lay out the first page. Offset requests
+    get the total from the page query itself.
     """
+    from sqlalchemy import tuple_
     from sqlmodel import func
 
-    # Get total count
-    count_statement = (
-        select(func.count()).select_from(ImportSession).where(ImportSession.ledger_id == ledger_id)
-    )
-    total = session.exec(count_statement).one()
-
-    # Get paginated items
-    statement = (
-        select(ImportSession)
-        .where(ImportSession.ledger_id == ledger_id)
-        .order_by(ImportSession.created_at.desc())  # type: ignore[attr-defined]
-        .offset(offset)
-        .limit(limit)
-    )
-    items = session.exec(statement).all()
+    newest_first = (col(ImportSession.created_at).desc(), col(ImportSession.id).desc())
+
+    # Get paginated items; one extra row tells whether another page follows
+    total = None
+    if cursor:
+        cursor_session = session.get(ImportSession, cursor)
+        if not cursor_session or cursor_session.ledger_id != ledger_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid cursor: {cursor}"
+            )
+        statement = (
+            select(ImportSession)
+            .where(
+                ImportSession.ledger_id == ledger_id,
+                tuple_(ImportSession.created_at, ImportSession.id)
+                < tuple_(cursor_session.created_at, cursor_session.id),
+            )
+            .order_by(*newest_first)
+            .limit(limit + 1)
+        )
+        items = list(session.exec(statement).all())
+    else:
+        # The window count returns the total with the page in the same query
+        page_statement = (
+            select(ImportSession, func.count().over())
+            .where(ImportSession.ledger_id == ledger_id)
+            .order_by(*newest_first)
+            .offset(offset)
+            .limit(limit + 1)
+        )
+        rows = session.exec(page_statement).all()
+        items = [item for item, _ in rows]
+        if rows:
+            total = rows[0][1]
+        else:
+            # Past the last page (or no imports): no row to carry the total
+            count_statement = (
+                select(func.count())
+                .select_from(ImportSession)
+                .where(ImportSession.ledger_id == ledger_id)
+            )
+            total = session.exec(count_statement).one()
+
+    has_more = len(items) > limit
+    items = items[:limit]
 
     return {
         "items": [
@@ -384,4 +421,5 @@ async def get_import_history(
             for item in items
         ],
         "total": total,
+        "next_cursor": str(items[-1].id) if has_more else None,
     }
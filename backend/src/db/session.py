@@ -12,6 +12,8 @@ engine = create_engine(
     settings.database_url,
     echo=settings.is_development,
     pool_pre_ping=True,
+    # Room for every statement shape the app issues, so compiled SQL stays cached
+    query_cache_size=1200,
 )
 
 
@@ -1,5 +1,7 @@
 """SQLModel models for LedgerOne."""
 
+# Importing account_balance registers the hooks that maintain Account.current_balance
+from src.models import account_balance  # noqa: F401
 from src.models.account import Account, AccountType
 
 # Add Advanced models
@@ -21,6 +23,7 @@ from src.models.email_import_batch import EmailImportBatch, EmailImportStatus
 from src.models.import_session import ImportSession, ImportStatus
 from src.models.ledger import Ledger
 from src.models.transaction import Transaction, TransactionType
+from src.models.transaction_month_rollup import TransactionMonthRollup
 from src.models.transaction_template import TransactionTemplate
 from src.models.user import User, UserBase, UserCreate, UserRead, UserSetup
 from src.schemas.data_import import ImportType
@@ -36,6 +39,7 @@ __all__ = [
     "AccountType",
     "Transaction",
     "TransactionType",
+    "TransactionMonthRollup",
     "TransactionTemplate",
     "AuditLog",
     "AuditAction",
@@ -10,7 +10,7 @@ from decimal import Decimal
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import Column
+from sqlalchemy import Column, Index
 from sqlalchemy import Enum as SAEnum
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -40,12 +40,26 @@ class Account(SQLModel, table=True):
     """
 
     __tablename__ = "accounts"
+    __table_args__ = (
+        # Serves the dashboard's per-ledger, per-type account listing and its ORDER BY
+        Index(
+            "idx_accounts_ledger_type_archived",
+            "ledger_id",
+            "type",
+            "is_archived",
+            "sort_order",
+            "name",
+        ),
+    )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     ledger_id: uuid.UUID = Field(foreign_key="ledgers.id", index=True)
     name: str = Field(max_length=100)
     type: AccountType = Field(sa_column=Column(SAEnum(AccountType)))
     balance: Decimal = Field(default=Decimal("0"), max_digits=15, decimal_places=2)
+    # Own balance from all transactions (excluding descendants), kept up to date
+    # by the Transaction hooks in src.models.account_balance
+    current_balance: Decimal = Field(default=Decimal("0"), max_digits=15, decimal_places=2)
     is_system: bool = Field(default=False)
 
     # Hierarchy fields
@@ -0,0 +1,138 @@
+"""Maintenance of Account.current_balance.
+
+Every transaction moves its amount out of from_account and into to_account.
+ORM event hooks on Transaction collect those movements per account while a
+flush runs. After the flush, one batched UPDATE applies them to the stored
+current_balance in the same database transaction as the write, so reads of the
+current balance need no aggregation over transactions. Accounts loaded in the
+session have current_balance expired so their next read sees the new value.
+"""
+
+import uuid
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import Update, bindparam, case, event, inspect, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, object_session
+
+from src.models.account import Account, AccountType
+from src.models.transaction import Transaction
+
+# Transaction attributes that determine which balances an amount belongs to
+_BALANCE_ATTRS = ("from_account_id", "to_account_id", "amount")
+
+# Session.info keys: per-account [incoming, outgoing] totals collected during a
+# flush, and the accounts whose loaded current_balance is stale after it
+_PENDING_DELTAS = "account_balance_deltas"
+_STALE_ACCOUNTS = "account_balance_stale"
+
+
+def _balance_update_statement() -> Update:
+    """Add incoming/outgoing amounts to an account, signed by its type.
+
+    For Asset: incoming - outgoing
+    For Liability: outgoing - incoming
+    For Income: outgoing
+    For Expense: incoming
+    """
+    table = Account.__table__
+    balance_type = table.c.current_balance.type
+    incoming = bindparam("delta_incoming", type_=balance_type)
+    outgoing = bindparam("delta_outgoing", type_=balance_type)
+    signed = case(
+        (table.c.type == AccountType.ASSET, incoming - outgoing),
+        (table.c.type == AccountType.LIABILITY, outgoing - incoming),
+        (table.c.type == AccountType.INCOME, outgoing),
+        else_=incoming,
+    )
+    return (
+        update(table)
+        .where(table.c.id == bindparam("delta_account_id", type_=table.c.id.type))
+        .values(current_balance=table.c.current_balance + signed)
+    )
+
+
+_BALANCE_UPDATE = _balance_update_statement()
+
+
+def _record_transfer(
+    target: Transaction,
+    from_account_id: uuid.UUID,
+    to_account_id: uuid.UUID,
+    amount: Decimal,
+) -> None:
+    """Queue moving amount from one account to another (negative amount reverses it)."""
+    if not amount:
+        return
+    session = object_session(target)
+    deltas = session.info.setdefault(_PENDING_DELTAS, {})
+    zero = Decimal("0")
+    deltas.setdefault(to_account_id, [zero, zero])[0] += amount
+    deltas.setdefault(from_account_id, [zero, zero])[1] += amount
+
+
+@event.listens_for(Session, "before_flush")
+def _reset_balance_deltas(session: Session, _flush_context: Any, _instances: Any) -> None:
+    # Drop anything left over from a flush that failed before applying it
+    session.info.pop(_PENDING_DELTAS, None)
+
+
+@event.listens_for(Session, "after_flush")
+def _apply_balance_deltas(session: Session, _flush_context: Any) -> None:
+    deltas = session.info.pop(_PENDING_DELTAS, None)
+    if not deltas:
+        return
+    # Sorted so concurrent flushes lock account rows in the same order
+    params = [
+        {"delta_account_id": account_id, "delta_incoming": incoming, "delta_outgoing": outgoing}
+        for account_id, (incoming, outgoing) in sorted(deltas.items(), key=lambda i: str(i[0]))
+        if incoming or outgoing
+    ]
+    if params:
+        session.connection().execute(_BALANCE_UPDATE, params)
+        session.info.setdefault(_STALE_ACCOUNTS, set()).update(deltas)
+
+
+@event.listens_for(Session, "after_flush_postexec")
+def _expire_stale_balances(session: Session, _flush_context: Any) -> None:
+    for account_id in session.info.pop(_STALE_ACCOUNTS, ()):
+        account = session.identity_map.get(session.identity_key(Account, account_id))
+        if account is not None:
+            session.expire(account, ["current_balance"])
+
+
+@event.listens_for(Transaction, "after_insert")
+def _balance_after_insert(_mapper: Any, _connection: Connection, target: Transaction) -> None:
+    _record_transfer(target, target.from_account_id, target.to_account_id, Decimal(target.amount))
+
+
+@event.listens_for(Transaction, "after_delete")
+def _balance_after_delete(_mapper: Any, _connection: Connection, target: Transaction) -> None:
+    _record_transfer(target, target.from_account_id, target.to_account_id, -Decimal(target.amount))
+
+
+@event.listens_for(Transaction, "after_update")
+def _balance_after_update(_mapper: Any, _connection: Connection, target: Transaction) -> None:
+    state = inspect(target)
+    histories = {attr: state.attrs[attr].history for attr in _BALANCE_ATTRS}
+    if not any(history.has_changes() for history in histories.values()):
+        return
+
+    def old_value(attr: str) -> Any:
+        deleted = histories[attr].deleted
+        return deleted[0] if deleted else getattr(target, attr)
+
+    _record_transfer(
+        target,
+        old_value("from_account_id"),
+        old_value("to_account_id"),
+        -Decimal(old_value("amount")),
+    )
+    _record_transfer(target, target.from_account_id, target.to_account_id, Decimal(target.amount))
+
+
+# Load the previous value on assignment, even for expired attributes, so
+# _balance_after_update can always reverse the old movement.
+for _attr in _BALANCE_ATTRS:
+    event.listen(getattr(Transaction, _attr), "set", lambda *_args: None, active_history=True)
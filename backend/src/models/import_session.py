@@ -9,7 +9,7 @@ from datetime import UTC, datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Column
+from sqlalchemy import Column, Index
 from sqlalchemy import Enum as SAEnum
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -37,6 +37,10 @@ class ImportSession(SQLModel, table=True):
     """
 
     __tablename__ = "import_sessions"
+    __table_args__ = (
+        # Import history pages seek newest-first within a ledger
+        Index("idx_import_sessions_ledger_created", "ledger_id", "created_at", "id"),
+    )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     ledger_id: uuid.UUID = Field(foreign_key="ledgers.id", index=True)
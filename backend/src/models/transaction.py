@@ -48,6 +48,17 @@ class Transaction(SQLModel, table=True):
     __table_args__ = (
         # Composite index for efficient ledger transaction listing sorted by date
         Index("idx_transactions_ledger_date", "ledger_id", "date"),
+        # Per-account balance sums and account transaction listings
+        Index("idx_transactions_from_account_date", "from_account_id", "date"),
+        Index("idx_transactions_to_account_date", "to_account_id", "date"),
+        # Income/expense period sums; INCLUDE lets PostgreSQL answer from the index
+        Index(
+            "idx_transactions_ledger_type_date",
+            "ledger_id",
+            "transaction_type",
+            "date",
+            postgresql_include=["amount"],
+        ),
     )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
@@ -0,0 +1,142 @@
+"""TransactionMonthRollup model for dashboard trends.
+
+Keeps per-ledger monthly totals for each transaction type so trend charts can
+read a handful of pre-aggregated rows instead of scanning the transactions table.
+Rows are maintained by ORM event hooks on Transaction: amounts are collected
+per row key while a flush runs and upserted in one batch after it, in the same
+database transaction as the write.
+"""
+
+import uuid
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import Column, event, inspect
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, object_session
+from sqlmodel import Field, SQLModel
+
+from src.models.transaction import Transaction, TransactionType
+
+# Transaction attributes that determine which rollup row an amount belongs to
+_ROLLUP_ATTRS = ("ledger_id", "date", "transaction_type", "amount")
+
+# Session.info key for the per-row-key totals collected during a flush
+_PENDING_DELTAS = "transaction_month_rollup_deltas"
+
+
+class TransactionMonthRollup(SQLModel, table=True):
+    """Total transaction amount per (ledger, year, month, transaction type)."""
+
+    __tablename__ = "transaction_month_rollups"
+
+    ledger_id: uuid.UUID = Field(foreign_key="ledgers.id", primary_key=True, ondelete="CASCADE")
+    year: int = Field(primary_key=True)
+    month: int = Field(primary_key=True)
+    transaction_type: TransactionType = Field(
+        sa_column=Column(
+            SAEnum(TransactionType, native_enum=False, length=20),
+            primary_key=True,
+        )
+    )
+    total_amount: Decimal = Field(default=Decimal("0"), max_digits=15, decimal_places=2)
+
+
+def _record_rollup_delta(
+    target: Transaction,
+    ledger_id: uuid.UUID,
+    txn_date: date,
+    transaction_type: TransactionType | None,
+    delta: Decimal,
+) -> None:
+    """Queue adding delta to the rollup row for the given key."""
+    if transaction_type is None or not delta:
+        return
+
+    deltas = object_session(target).info.setdefault(_PENDING_DELTAS, {})
+    key = (ledger_id, txn_date.year, txn_date.month, transaction_type)
+    deltas[key] = deltas.get(key, Decimal("0")) + delta
+
+
+@event.listens_for(Session, "before_flush")
+def _reset_rollup_deltas(session: Session, _flush_context: Any, _instances: Any) -> None:
+    # Drop anything left over from a flush that failed before applying it
+    session.info.pop(_PENDING_DELTAS, None)
+
+
+@event.listens_for(Session, "after_flush")
+def _apply_rollup_deltas(session: Session, _flush_context: Any) -> None:
+    """Add the collected deltas to their rollup rows, creating rows as needed."""
+    deltas = session.info.pop(_PENDING_DELTAS, None)
+    if not deltas:
+        return
+    params = [
+        {
+            "ledger_id": ledger_id,
+            "year": year,
+            "month": month,
+            "transaction_type": transaction_type,
+            "total_amount": delta,
+        }
+        for (ledger_id, year, month, transaction_type), delta in deltas.items()
+        if delta
+    ]
+    if not params:
+        return
+
+    connection = session.connection()
+    table = TransactionMonthRollup.__table__
+    insert = pg_insert if connection.dialect.name == "postgresql" else sqlite_insert
+    stmt = insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["ledger_id", "year", "month", "transaction_type"],
+        set_={"total_amount": table.c.total_amount + stmt.excluded.total_amount},
+    )
+    connection.execute(stmt, params)
+
+
+@event.listens_for(Transaction, "after_insert")
+def _rollup_after_insert(_mapper: Any, _connection: Connection, target: Transaction) -> None:
+    _record_rollup_delta(
+        target, target.ledger_id, target.date, target.transaction_type, Decimal(target.amount)
+    )
+
+
+@event.listens_for(Transaction, "after_delete")
+def _rollup_after_delete(_mapper: Any, _connection: Connection, target: Transaction) -> None:
+    _record_rollup_delta(
+        target, target.ledger_id, target.date, target.transaction_type, -Decimal(target.amount)
+    )
+
+
+@event.listens_for(Transaction, "after_update")
+def _rollup_after_update(_mapper: Any, _connection: Connection, target: Transaction) -> None:
+    state = inspect(target)
+    histories = {attr: state.attrs[attr].history for attr in _ROLLUP_ATTRS}
+    if not any(history.has_changes() for history in histories.values()):
+        return
+
+    def old_value(attr: str) -> Any:
+        deleted = histories[attr].deleted
+        return deleted[0] if deleted else getattr(target, attr)
+
+    _record_rollup_delta(
+        target,
+        old_value("ledger_id"),
+        old_value("date"),
+        old_value("transaction_type"),
+        -Decimal(old_value("amount")),
+    )
+    _record_rollup_delta(
+        target, target.ledger_id, target.date, target.transaction_type, Decimal(target.amount)
+    )
+
+
+# Load the previous value on assignment, even for expired attributes, so
+# _rollup_after_update can always subtract the old amount from the old bucket.
+for _attr in _ROLLUP_ATTRS:
+    event.listen(getattr(Transaction, _attr), "set", lambda *_args: None, active_history=True)
@@ -234,20 +234,18 @@ class AccountService:
         descendant_ids = self.get_descendant_ids(account_id)
 
         # Sum of transactions where any descendant is the destination (incoming)
-        incoming_result = self.session.exec(
+        incoming = self.session.exec(
             select(func.coalesce(func.sum(Transaction.amount), Decimal("0"))).where(
                 Transaction.to_account_id.in_(descendant_ids)
             )
         ).one()
-        incoming = Decimal(str(incoming_result)) if incoming_result else Decimal("0")
 
         # Sum of transactions where any descendant is the source (outgoing)
-        outgoing_result = self.session.exec(
+        outgoing = self.session.exec(
             select(func.coalesce(func.sum(Transaction.amount), Decimal("0"))).where(
                 Transaction.from_account_id.in_(descendant_ids)
             )
         ).one()
-        outgoing = Decimal(str(outgoing_result)) if outgoing_result else Decimal("0")
 
         if account.type == AccountType.ASSET:
             return incoming - outgoing
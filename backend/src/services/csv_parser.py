@@ -1,11 +1,25 @@
+import codecs
 import csv
 import io
 import re
-from datetime import date
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 from typing import BinaryIO
 
 import charset_normalizer
 
+from src.schemas.data_import import (
+    AccountType,
+    ParsedAccountPath,
+    ParsedTransaction,
+    TransactionType,
+    ValidationError,
+    ValidationErrorType,
+)
+from src.services.bank_configs import get_bank_config, get_bank_statement_config
+from src.services.category_suggester import CategorySuggester
+
 
 class CsvParser:
     @staticmethod
@@ -38,38 +52,133 @@ class CsvParser:
         if encoding is None:
             encoding = CsvParser.detect_encoding(file)
 
-        # Reset file pointer just in case
-        file.seek(0)
+        content = CsvParser._decode(file, encoding)
+        f = io.StringIO(content)
+        reader = csv.DictReader(f)
+
+        return list(reader)
 
+    @staticmethod
+    def _decode(file: BinaryIO, encoding: str) -> str:
+        """
+        Read the whole file from the start and decode it.
+
+        Any UTF-8 alias is decoded as utf-8-sig so a leading BOM is dropped by the codec.
+        """
+        codec = "utf-8-sig" if codecs.lookup(encoding).name == "utf-8" else encoding
+
+        file.seek(0)
         try:
-            content = file.read().decode(encoding)
+            return file.read().decode(codec)
         except UnicodeDecodeError as e:
             # If explicit encoding failed or detection was wrong
             raise ValueError(f"Failed to decode file with encoding {encoding}: {e}") from e
 
-        # Remove BOM if present (utf-8-sig)
-        if content.startswith("\ufeff"):
-            content = content[1:]
+    @staticmethod
+    def _read_rows(content: str) -> list[list[str]]:
+        """
+        Tokenize already-decoded CSV text into rows.
 
-        f = io.StringIO(content)
-        reader = csv.DictReader(f)
+        io.StringIO splits records on newlines only. str.splitlines would also
+        break on NEL (U+0085) or U+2028, which bank memo fields can
+        contain unquoted.
+        """
+        return list(csv.reader(io.StringIO(content)))
 
-        return list(reader)
+    @staticmethod
+    def _slice_after_header(content: str, header_marker: str) -> str | None:
+        """
+        Return the raw text following the line that contains header_marker.
 
+        Lets bank parsers skip CSV tokenization of preamble rows entirely.
+        Returns None if the marker is not found.
+        """
+        marker_pos = content.find(header_marker)
+        if marker_pos == -1:
+            return None
+        header_end = content.find("\n", marker_pos)
+        if header_end == -1:
+            return ""
+        return content[header_end + 1 :]
 
-from datetime import datetime
-from decimal import Decimal, InvalidOperation
 
-from src.schemas.data_import import (
-    AccountType,
-    ParsedAccountPath,
-    ParsedTransaction,
-    TransactionType,
-    ValidationError,
-    ValidationErrorType,
+# Thousands separators and currency symbols stripped from bank amount cells in one pass.
+# Cleaned amounts go straight to Decimal(str): the C decimal parser is already faster than
+# building Decimal digit tuples in Python, so there is no regex pre-validation step.
+_AMOUNT_STRIP_TABLE = str.maketrans("", "", ",$")
+
+
+def _validation_error(
+    row_number: int,
+    error_type: ValidationErrorType,
+    message: str,
+    value: str | None = None,
+) -> ValidationError:
+    """Build a ValidationError without re-running field validation on parser-controlled input."""
+    return ValidationError.model_construct(
+        row_number=row_number, error_type=error_type, message=message, value=value
+    )
+
+
+# strptime formats that can be served by the date.fromisoformat fast path, keyed to their separator
+_YMD_FORMAT_SEPARATORS = {"%Y-%m-%d": "-", "%Y/%m/%d": "/"}
+
+
+def _parse_ymd_fast(date_str: str, sep: str) -> date | None:
+    """
+    Parse a zero-padded YYYY<sep>MM<sep>DD string with date.fromisoformat.
+
+    Returns None if the string is not in that exact shape, so callers can fall back to strptime.
+    """
+    if len(date_str) != 10 or date_str[4] != sep or date_str[7] != sep:
+        return None
+    try:
+        return date.fromisoformat(date_str if sep == "-" else date_str.replace(sep, "-"))
+    except ValueError:
+        return None
+
+
+# Account paths shared read-only by every parsed transaction that uses them
+_OTHER_INCOME_PATH = ParsedAccountPath(
+    account_type=AccountType.INCOME,
+    path_segments=["其他收入"],
+    raw_name="其他收入",
 )
 
 
+@lru_cache(maxsize=256)
+def _expense_path(account_name: str) -> ParsedAccountPath:
+    """Return the (cached) single-level expense path for a suggested category name."""
+    return ParsedAccountPath(
+        account_type=AccountType.EXPENSE,
+        path_segments=[account_name],
+        raw_name=account_name,
+    )
+
+
+# MyAB account type prefixes (e.g. "L-信用卡")
+_ACCOUNT_PREFIX_TYPES = {
+    "A-": AccountType.ASSET,
+    "L-": AccountType.LIABILITY,
+    "I-": AccountType.INCOME,
+    "E-": AccountType.EXPENSE,
+}
+
+# Leading single/double char prefix ending in "-" (e.g. "L-", "E-") stripped from account names
+_ACCOUNT_PREFIX_RE = re.compile(r"[^-]{0,2}-")
+
+# Full-format 交易類型 -> (transaction type, from-account column, to-account column).
+# English keys are lowercase; Chinese values match directly without .lower().
+_FULL_FORMAT_TYPE_DISPATCH: dict[str, tuple[TransactionType, str, str]] = {
+    "支出": (TransactionType.EXPENSE, "從科目", "支出科目"),
+    "expense": (TransactionType.EXPENSE, "從科目", "支出科目"),
+    "收入": (TransactionType.INCOME, "收入科目", "到科目"),
+    "income": (TransactionType.INCOME, "收入科目", "到科目"),
+    "轉帳": (TransactionType.TRANSFER, "從科目", "到科目"),
+    "transfer": (TransactionType.TRANSFER, "從科目", "到科目"),
+}
+
+
 class MyAbCsvParser(CsvParser):
     """
     Parser for MyAB CSV export files.
@@ -106,7 +215,7 @@ class MyAbCsvParser(CsvParser):
 
             except Exception as e:
                 errors.append(
-                    ValidationError(
+                    _validation_error(
                         row_number=i,
                         error_type=ValidationErrorType.INVALID_FORMAT,
                         message=f"Unexpected error: {str(e)}",
@@ -133,7 +242,7 @@ class MyAbCsvParser(CsvParser):
         amount_str = row.get("金額")
 
         if not date_str or not category or not account or not amount_str:
-            return None, ValidationError(
+            return None, _validation_error(
                 row_number=row_number,
                 error_type=ValidationErrorType.MISSING_COLUMN,
                 message="Missing required fields (日期, 分類, 科目, or 金額)",
@@ -144,7 +253,7 @@ class MyAbCsvParser(CsvParser):
         try:
             parsed_date = self._parse_date(date_str)
         except ValueError as e:
-            return None, ValidationError(
+            return None, _validation_error(
                 row_number=row_number,
                 error_type=ValidationErrorType.INVALID_DATE,
                 message=str(e),
@@ -155,7 +264,7 @@ class MyAbCsvParser(CsvParser):
         try:
             amount = Decimal(amount_str.replace(",", ""))
         except InvalidOperation:
-            return None, ValidationError(
+            return None, _validation_error(
                 row_number=row_number,
                 error_type=ValidationErrorType.INVALID_AMOUNT,
                 message=f"Invalid amount format: {amount_str}",
@@ -188,7 +297,7 @@ class MyAbCsvParser(CsvParser):
             from_path = account_path
             to_path = category_path
         else:
-            return None, ValidationError(
+            return None, _validation_error(
                 row_number=row_number,
                 error_type=ValidationErrorType.UNKNOWN_ACCOUNT_TYPE,
                 message=f"Cannot determine transaction type from category: {category}",
@@ -220,7 +329,7 @@ class MyAbCsvParser(CsvParser):
         amount_str = row.get("金額")
 
         if not date_str or not type_str or not amount_str:
-            return None, ValidationError(
+            return None, _validation_error(
                 row_number=row_number,
                 error_type=ValidationErrorType.MISSING_COLUMN,
                 message="Missing required fields (日期, 交易類型, or 金額)",
@@ -231,7 +340,7 @@ class MyAbCsvParser(CsvParser):
         try:
             parsed_date = self._parse_date(date_str)
         except ValueError as e:
-            return None, ValidationError(
+            return None, _validation_error(
                 row_number=row_number,
                 error_type=ValidationErrorType.INVALID_DATE,
                 message=str(e),
@@ -242,51 +351,38 @@ class MyAbCsvParser(CsvParser):
         try:
             amount = Decimal(amount_str.replace(",", ""))
         except InvalidOperation:
-            return None, ValidationError(
+            return None, _validation_error(
                 row_number=row_number,
                 error_type=ValidationErrorType.INVALID_AMOUNT,
                 message=f"Invalid amount format: {amount_str}",
                 value=amount_str,
             )
 
-        # Determine Transaction Type and Accounts
-        tx_type_enum = None
-        from_acc = None
-        to_acc = None
-
-        # Support English and Chinese types
-        type_str_lower = type_str.lower() if type_str else ""
-
-        if type_str == "支出" or type_str_lower == "expense":
-            tx_type_enum = TransactionType.EXPENSE
-            from_acc = row.get("從科目")
-            to_acc = row.get("支出科目")
-        elif type_str == "收入" or type_str_lower == "income":
-            tx_type_enum = TransactionType.INCOME
-            from_acc = row.get("收入科目")
-            to_acc = row.get("到科目")
-        elif type_str == "轉帳" or type_str_lower == "transfer":
-            tx_type_enum = TransactionType.TRANSFER
-            from_acc = row.get("從科目")
-            to_acc = row.get("到科目")
-
-        if not tx_type_enum:
-            return None, ValidationError(
+        # Determine Transaction Type and Accounts (supports English and Chinese types)
+        dispatch = _FULL_FORMAT_TYPE_DISPATCH.get(type_str) or _FULL_FORMAT_TYPE_DISPATCH.get(
+            type_str.lower()
+        )
+        if dispatch is None:
+            return None, _validation_error(
                 row_number=row_number,
                 error_type=ValidationErrorType.INVALID_FORMAT,
                 message=f"Unknown transaction type: {type_str}",
                 value=type_str,
             )
 
+        tx_type_enum, from_column, to_column = dispatch
+        from_acc = row.get(from_column)
+        to_acc = row.get(to_column)
+
         if not from_acc:
-            return None, ValidationError(
+            return None, _validation_error(
                 row_number=row_number,
                 error_type=ValidationErrorType.MISSING_COLUMN,
                 message="Missing source account",
                 value="from_account",
             )
         if not to_acc:
-            return None, ValidationError(
+            return None, _validation_error(
                 row_number=row_number,
                 error_type=ValidationErrorType.MISSING_COLUMN,
                 message="Missing destination account",
@@ -312,6 +408,10 @@ class MyAbCsvParser(CsvParser):
         return tx, None
 
     def _parse_date(self, date_str: str) -> date:
+        if len(date_str) > 4 and date_str[4] in "/-":
+            parsed = _parse_ymd_fast(date_str, date_str[4])
+            if parsed is not None:
+                return parsed
         formats = ["%Y/%m/%d", "%Y-%m-%d", "%m/%d/%Y"]
         for fmt in formats:
             try:
@@ -325,15 +425,7 @@ class MyAbCsvParser(CsvParser):
         """
         Parse account type from prefix (A-, L-, I-, E-).
         """
-        if account_name.startswith("A-"):
-            return AccountType.ASSET
-        if account_name.startswith("L-"):
-            return AccountType.LIABILITY
-        if account_name.startswith("I-"):
-            return AccountType.INCOME
-        if account_name.startswith("E-"):
-            return AccountType.EXPENSE
-        return None
+        return _ACCOUNT_PREFIX_TYPES.get(account_name[:2])
 
     @staticmethod
     def parse_hierarchical_account(account_name: str) -> ParsedAccountPath:
@@ -346,20 +438,17 @@ class MyAbCsvParser(CsvParser):
             raw_name="L-信用卡.國泰世華信用卡.Cube卡"
         )
         """
-        account_type = MyAbCsvParser.parse_account_prefix(account_name)
+        account_type = _ACCOUNT_PREFIX_TYPES.get(account_name[:2])
 
         # Remove prefix (e.g. "L-", "E-")
         name_without_prefix = account_name
-        if "-" in account_name and len(account_name) > 2:
-            prefix_end = account_name.index("-")
-            if prefix_end <= 2:  # Only handle single/double char prefixes like "L-", "E-"
-                name_without_prefix = account_name[prefix_end + 1 :]
-
-        # Split by "." to get hierarchy
-        path_segments = name_without_prefix.split(".")
+        if len(account_name) > 2:
+            m = _ACCOUNT_PREFIX_RE.match(account_name)
+            if m:
+                name_without_prefix = account_name[m.end() :]
 
-        # Filter out empty segments
-        path_segments = [seg.strip() for seg in path_segments if seg.strip()]
+        # Split by "." to get hierarchy, dropping empty segments
+        path_segments = [seg for part in name_without_prefix.split(".") if (seg := part.strip())]
 
         return ParsedAccountPath(
             account_type=account_type or AccountType.ASSET,
@@ -384,12 +473,24 @@ class CreditCardCsvParser(CsvParser):
         Raises:
             ValueError: If bank is not supported
         """
-        from src.services.bank_configs import get_bank_config
-
         self.config = get_bank_config(bank_code)
         if self.config is None:
             raise ValueError(f"Unsupported bank: {bank_code}")
 
+    def _extract_bill_period(self, first_line: str | None, config) -> tuple[int, int]:
+        """
+        Extract bill year/month from the first line using date_year_pattern.
+
+        Returns:
+            (bill_year, bill_month), defaulting to today's year/month
+        """
+        today = date.today()
+        if config.date_year_pattern and first_line:
+            m = re.search(config.date_year_pattern, first_line)
+            if m:
+                return int(m.group(1)), int(m.group(2))
+        return today.year, today.month
+
     def _find_data_start_row(self, rows: list[list[str]], config) -> tuple[int, int, int]:
         """
         Locate data start row using header_marker, and extract bill year/month from first row.
@@ -397,17 +498,9 @@ class CreditCardCsvParser(CsvParser):
         Returns:
             (data_start_idx, bill_year, bill_month)
         """
-        today = date.today()
-        bill_year = today.year
-        bill_month = today.month
-
         # Try to extract year/month from the first non-empty row
-        if config.date_year_pattern and rows:
-            first_line = ",".join(rows[0])
-            m = re.search(config.date_year_pattern, first_line)
-            if m:
-                bill_year = int(m.group(1))
-                bill_month = int(m.group(2))
+        first_line = ",".join(rows[0]) if rows else None
+        bill_year, bill_month = self._extract_bill_period(first_line, config)
 
         # Dynamically find header row by marker
         if config.header_marker:
@@ -428,10 +521,6 @@ class CreditCardCsvParser(CsvParser):
             return bill_year
         return bill_year - 1
 
-    def _is_skip_row(self, row: list[str]) -> bool:
-        """Return True if the row should be silently skipped (empty or too short to be data)."""
-        return not row or all(cell.strip() == "" for cell in row)
-
     def parse(self, file: BinaryIO) -> tuple[list[ParsedTransaction], list[ValidationError]]:
         """
         Parse credit card CSV file.
@@ -442,34 +531,48 @@ class CreditCardCsvParser(CsvParser):
         Returns:
             Tuple of (List of ParsedTransaction objects, List of ValidationError objects)
         """
-        from src.services.category_suggester import CategorySuggester
-
         if self.config is None:
             raise ValueError("Parser not initialized with valid bank config")
 
         # Read raw CSV rows
         encoding = self.config.encoding or self.detect_encoding(file)
-        file.seek(0)
+        content = self._decode(file, encoding)
 
-        try:
-            content = file.read().decode(encoding)
-        except UnicodeDecodeError as e:
-            raise ValueError(f"Failed to decode file with encoding {encoding}: {e}") from e
-
-        # Remove BOM if present
-        if content.startswith("\ufeff"):
-            content = content[1:]
-
-        f = io.StringIO(content)
-        reader = csv.reader(f)
-        rows = list(reader)
+        # Fast path: find the header marker in the raw text and only tokenize the rows after it
+        data_content = (
+            self._slice_after_header(content, self.config.header_marker)
+            if self.config.header_marker
+            else None
+        )
+        if data_content is not None:
+            first_line = content.split("\n", 1)[0]
+            bill_year, bill_month = self._extract_bill_period(first_line, self.config)
+            data_rows = self._read_rows(data_content)
+        else:
+            rows = self._read_rows(content)
 
-        # Dynamically locate the data start row (supports real-format bank CSVs)
-        data_start, bill_year, bill_month = self._find_data_start_row(rows, self.config)
-        data_rows = rows[data_start:]
+            # Dynamically locate the data start row (supports real-format bank CSVs)
+            data_start, bill_year, bill_month = self._find_data_start_row(rows, self.config)
+            data_rows = rows[data_start:]
 
         needs_year_inference = "%Y" not in self.config.date_format
 
+        # Bind per-file constants once instead of re-reading the config on every row
+        date_col = self.config.date_column
+        desc_col = self.config.description_column
+        amt_col = self.config.amount_column
+        max_col = max(date_col, desc_col, amt_col)
+        date_format = self.config.date_format
+        ymd_sep = _YMD_FORMAT_SEPARATORS.get(date_format)
+        skip_negative = self.config.skip_negative_amounts
+        from_account_name = f"信用卡-{self.config.name}"
+        # Shared by every transaction of this file; treated as read-only
+        from_account_path = ParsedAccountPath(
+            account_type=AccountType.LIABILITY,
+            path_segments=["信用卡", self.config.name],
+            raw_name=from_account_name,
+        )
+
         # Initialize category suggester
         suggester = CategorySuggester()
 
@@ -478,24 +581,16 @@ class CreditCardCsvParser(CsvParser):
 
         for i, row in enumerate(data_rows, start=1):
             try:
-                # Skip blank / footer rows silently
-                if self._is_skip_row(row):
-                    continue
-
-                # Validate row has enough columns
-                max_col = max(
-                    self.config.date_column,
-                    self.config.description_column,
-                    self.config.amount_column,
-                )
+                # Rows with insufficient columns (blank lines, footer summaries) are silently
+                # skipped; this cheap length check runs before any per-cell string work
                 if len(row) <= max_col:
-                    # Rows with insufficient columns are silently skipped (e.g. footer summaries)
                     continue
 
-                date_str = row[self.config.date_column].strip()
+                date_str = row[date_col].strip()
 
-                # Skip non-transaction rows where date is a dash variant (e.g. "−", "-")
-                if date_str in self._SKIP_DATE_VALUES:
+                # Skip non-transaction rows: blank date (including all-blank rows) or a
+                # dash variant (e.g. "−", "-")
+                if not date_str or date_str in self._SKIP_DATE_VALUES:
                     continue
 
                 # Parse date
@@ -511,10 +606,11 @@ class CreditCardCsvParser(CsvParser):
                         inferred_year = self._resolve_year_for_mmdd(tx_month, bill_year, bill_month)
                         parsed_date = date(inferred_year, tx_month, tx_day)
                     else:
-                        parsed_date = datetime.strptime(date_str, self.config.date_format).date()
+                        fast_date = _parse_ymd_fast(date_str, ymd_sep) if ymd_sep else None
+                        parsed_date = fast_date or datetime.strptime(date_str, date_format).date()
                 except ValueError:
                     errors.append(
-                        ValidationError(
+                        _validation_error(
                             row_number=i,
                             error_type=ValidationErrorType.INVALID_DATE,
                             message=f"Invalid date format: {date_str}",
@@ -524,13 +620,13 @@ class CreditCardCsvParser(CsvParser):
                     continue
 
                 # Parse amount
-                amount_str = row[self.config.amount_column].strip()
+                amount_str = row[amt_col].strip()
                 try:
-                    cleaned = amount_str.replace(",", "").replace("$", "").replace("NT", "")
+                    cleaned = amount_str.translate(_AMOUNT_STRIP_TABLE).replace("NT", "")
                     amount_decimal = Decimal(cleaned)
                 except InvalidOperation:
                     errors.append(
-                        ValidationError(
+                        _validation_error(
                             row_number=i,
                             error_type=ValidationErrorType.INVALID_AMOUNT,
                             message=f"Invalid amount format: {amount_str}",
@@ -540,13 +636,13 @@ class CreditCardCsvParser(CsvParser):
                     continue
 
                 # Skip negative amounts (payment / refund rows) if configured
-                if self.config.skip_negative_amounts and amount_decimal < 0:
+                if skip_negative and amount_decimal < 0:
                     continue
 
                 amount = abs(amount_decimal)
 
                 # Parse description
-                description = row[self.config.description_column].strip()
+                description = row[desc_col].strip()
 
                 # Get category suggestion
                 suggestion = suggester.suggest(description)
@@ -555,27 +651,19 @@ class CreditCardCsvParser(CsvParser):
                     row_number=i,
                     date=parsed_date,
                     transaction_type=TransactionType.EXPENSE,
-                    from_account_name=f"信用卡-{self.config.name}",
+                    from_account_name=from_account_name,
                     to_account_name=suggestion.suggested_account_name,
                     amount=amount,
                     description=description,
                     category_suggestion=suggestion,
-                    from_account_path=ParsedAccountPath(
-                        account_type=AccountType.LIABILITY,
-                        path_segments=["信用卡", self.config.name],
-                        raw_name=f"信用卡-{self.config.name}",
-                    ),
-                    to_account_path=ParsedAccountPath(
-                        account_type=AccountType.EXPENSE,
-                        path_segments=[suggestion.suggested_account_name],
-                        raw_name=suggestion.suggested_account_name,
-                    ),
+                    from_account_path=from_account_path,
+                    to_account_path=_expense_path(suggestion.suggested_account_name),
                 )
                 result.append(tx)
 
             except Exception as e:
                 errors.append(
-                    ValidationError(
+                    _validation_error(
                         row_number=i,
                         error_type=ValidationErrorType.INVALID_FORMAT,
                         message=f"Error parsing row {i}: {e}",
@@ -599,8 +687,6 @@ class BankStatementCsvParser(CsvParser):
         Raises:
             ValueError: If bank is not supported
         """
-        from src.services.bank_configs import get_bank_statement_config
-
         self.config = get_bank_statement_config(bank_code)
         if self.config is None:
             raise ValueError(f"Unsupported bank for statement import: {bank_code}")
@@ -615,7 +701,7 @@ class BankStatementCsvParser(CsvParser):
 
     def _parse_amount(self, raw: str) -> Decimal | None:
         """Parse a raw amount string. Returns None if empty or invalid."""
-        cleaned = raw.strip().replace(",", "").replace("$", "").replace("NT", "")
+        cleaned = raw.strip().translate(_AMOUNT_STRIP_TABLE).replace("NT", "")
         if not cleaned:
             return None
         try:
@@ -630,25 +716,45 @@ class BankStatementCsvParser(CsvParser):
         Returns:
             Tuple of (List of ParsedTransaction objects, List of ValidationError objects)
         """
-        from src.services.category_suggester import CategorySuggester
-
         encoding = self.config.encoding or self.detect_encoding(file)
-        file.seek(0)
-
-        try:
-            content = file.read().decode(encoding)
-        except UnicodeDecodeError as e:
-            raise ValueError(f"Failed to decode file with encoding {encoding}: {e}") from e
-
-        if content.startswith("\ufeff"):
-            content = content[1:]
+        content = self._decode(file, encoding)
 
-        f = io.StringIO(content)
-        reader = csv.reader(f)
-        rows = list(reader)
-
-        data_start = self._find_data_start_row(rows)
-        data_rows = rows[data_start:]
+        data_content = (
+            self._slice_after_header(content, self.config.header_marker)
+            if self.config.header_marker
+            else None
+        )
+        if data_content is not None:
+            data_rows = self._read_rows(data_content)
+        else:
+            rows = self._read_rows(content)
+
+            data_start = self._find_data_start_row(rows)
+            data_rows = rows[data_start:]
+
+        # Bind per-file constants once instead of re-reading the config on every row
+        date_col = self.config.date_column
+        desc_col = self.config.description_column
+        amount_col = self.config.amount_column
+        debit_col = self.config.debit_column
+        credit_col = self.config.credit_column
+        date_format = self.config.date_format
+        ymd_sep = _YMD_FORMAT_SEPARATORS.get(date_format)
+        bank_account_name = self.config.bank_account_name
+
+        required_cols = [date_col, desc_col]
+        if amount_col is not None:
+            required_cols.append(amount_col)
+        elif debit_col is not None and credit_col is not None:
+            required_cols += [debit_col, credit_col]
+        max_col = max(required_cols)
+
+        # Shared by every transaction of this file; treated as read-only
+        bank_account_path = ParsedAccountPath(
+            account_type=AccountType.ASSET,
+            path_segments=bank_account_name.split("."),
+            raw_name=bank_account_name,
+        )
 
         suggester = CategorySuggester()
         result = []
@@ -656,29 +762,20 @@ class BankStatementCsvParser(CsvParser):
 
         for i, row in enumerate(data_rows, start=1):
             try:
-                # Skip blank rows
-                if not row or all(cell.strip() == "" for cell in row):
-                    continue
-
-                # Validate minimum columns
-                required_cols = [self.config.date_column, self.config.description_column]
-                if self.config.amount_column is not None:
-                    required_cols.append(self.config.amount_column)
-                elif self.config.debit_column is not None and self.config.credit_column is not None:
-                    required_cols += [self.config.debit_column, self.config.credit_column]
-
-                if len(row) <= max(required_cols):
+                # Validate minimum columns (also skips blank lines)
+                if len(row) <= max_col:
                     continue
 
-                # Parse date
-                date_str = row[self.config.date_column].strip()
+                # Parse date; a blank date (including all-blank rows) means no transaction
+                date_str = row[date_col].strip()
                 if not date_str:
                     continue
                 try:
-                    parsed_date = datetime.strptime(date_str, self.config.date_format).date()
+                    fast_date = _parse_ymd_fast(date_str, ymd_sep) if ymd_sep else None
+                    parsed_date = fast_date or datetime.strptime(date_str, date_format).date()
                 except ValueError:
                     errors.append(
-                        ValidationError(
+                        _validation_error(
                             row_number=i,
                             error_type=ValidationErrorType.INVALID_DATE,
                             message=f"Invalid date format: {date_str}",
@@ -687,12 +784,12 @@ class BankStatementCsvParser(CsvParser):
                     )
                     continue
 
-                description = row[self.config.description_column].strip()
+                description = row[desc_col].strip()
 
                 # Determine debit / credit amounts
-                if self.config.amount_column is not None:
+                if amount_col is not None:
                     # Signed single-column mode
-                    amount_val = self._parse_amount(row[self.config.amount_column])
+                    amount_val = self._parse_amount(row[amount_col])
                     if amount_val is None:
                         continue
                     if amount_val < 0:
@@ -703,16 +800,8 @@ class BankStatementCsvParser(CsvParser):
                         credit_amount = amount_val
                 else:
                     # Dual-column mode: debit + credit
-                    debit_raw = (
-                        row[self.config.debit_column].strip()
-                        if self.config.debit_column is not None
-                        else ""
-                    )
-                    credit_raw = (
-                        row[self.config.credit_column].strip()
-                        if self.config.credit_column is not None
-                        else ""
-                    )
+                    debit_raw = row[debit_col].strip() if debit_col is not None else ""
+                    credit_raw = row[credit_col].strip() if credit_col is not None else ""
                     debit_amount = self._parse_amount(debit_raw) or Decimal("0")
                     credit_amount = self._parse_amount(credit_raw) or Decimal("0")
 
@@ -720,12 +809,6 @@ class BankStatementCsvParser(CsvParser):
                 if debit_amount == 0 and credit_amount == 0:
                     continue
 
-                bank_account_path = ParsedAccountPath(
-                    account_type=AccountType.ASSET,
-                    path_segments=self.config.bank_account_name.split("."),
-                    raw_name=self.config.bank_account_name,
-                )
-
                 if debit_amount > 0:
                     # Out-flow: EXPENSE — from bank account → expense category
                     suggestion = suggester.suggest(description)
@@ -733,17 +816,13 @@ class BankStatementCsvParser(CsvParser):
                         row_number=i,
                         date=parsed_date,
                         transaction_type=TransactionType.EXPENSE,
-                        from_account_name=self.config.bank_account_name,
+                        from_account_name=bank_account_name,
                         to_account_name=suggestion.suggested_account_name,
                         amount=debit_amount,
                         description=description,
                         category_suggestion=suggestion,
                         from_account_path=bank_account_path,
-                        to_account_path=ParsedAccountPath(
-                            account_type=AccountType.EXPENSE,
-                            path_segments=[suggestion.suggested_account_name],
-                            raw_name=suggestion.suggested_account_name,
-                        ),
+                        to_account_path=_expense_path(suggestion.suggested_account_name),
                     )
                     result.append(tx)
 
@@ -754,21 +833,17 @@ class BankStatementCsvParser(CsvParser):
                         date=parsed_date,
                         transaction_type=TransactionType.INCOME,
                         from_account_name="其他收入",
-                        to_account_name=self.config.bank_account_name,
+                        to_account_name=bank_account_name,
                         amount=credit_amount,
                         description=description,
-                        from_account_path=ParsedAccountPath(
-                            account_type=AccountType.INCOME,
-                            path_segments=["其他收入"],
-                            raw_name="其他收入",
-                        ),
+                        from_account_path=_OTHER_INCOME_PATH,
                         to_account_path=bank_account_path,
                     )
                     result.append(tx)
 
             except Exception as e:
                 errors.append(
-                    ValidationError(
+                    _validation_error(
                         row_number=i,
                         error_type=ValidationErrorType.INVALID_FORMAT,
                         message=f"Error parsing row {i}: {e}",
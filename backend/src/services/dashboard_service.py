@@ -4,15 +4,23 @@ Based on contracts/dashboard_service.md for feature 002-ui-layout-dashboard.
 Provides read-only aggregation endpoints for dashboard and sidebar.
 """
 
+import calendar
 import uuid
+from collections.abc import Sequence
 from datetime import date, timedelta
 from decimal import Decimal
 
-from sqlmodel import Session, func, select
+from sqlalchemy import case, text, tuple_
+from sqlmodel import Session, col, func, select
 
 from src.models.account import Account, AccountType
 from src.models.ledger import Ledger
 from src.models.transaction import Transaction, TransactionType
+from src.models.transaction_month_rollup import TransactionMonthRollup
+
+# Above this many (estimated) transaction rows, cursor-paginated requests skip
+# the exact COUNT(*) and return total_count=None.
+SIMPLE_PAGINATION_THRESHOLD = 10_000
 
 
 class DashboardService:
@@ -24,6 +32,7 @@ class DashboardService:
     def __init__(self, session: Session) -> None:
         """Initialize service with database session."""
         self.session = session
+        self._transaction_row_estimate: int | None = None
 
     def get_dashboard_summary(
         self,
@@ -39,14 +48,22 @@ class DashboardService:
             end_date: Optional end date for summary, assets, and trends
 
         Returns:
-            dict with total_assets, current_month, and trends
+            dict with total_assets, current_month, trends and date_range
+            (dates as date objects, serialized by the route)
 
         Raises:
             ValueError: If ledger doesn't exist
         """
-        # Verify ledger exists
-        ledger = self.session.get(Ledger, ledger_id)
-        if not ledger:
+        # Verify ledger exists and get the transaction date range in one query
+        ledger_exists = select(Ledger.id).where(Ledger.id == ledger_id).exists()
+        found, min_date, max_date = self.session.exec(
+            select(
+                ledger_exists,
+                func.min(Transaction.date),
+                func.max(Transaction.date),
+            ).where(Transaction.ledger_id == ledger_id)
+        ).one()
+        if not found:
             raise ValueError(f"Ledger not found: {ledger_id}")
 
         # Validate explicitly provided date range
@@ -61,13 +78,6 @@ class DashboardService:
             trend_start = start_date
         else:
             # Default behavior: Use range of all transactions
-            # Get min and max date from transactions
-            date_range_query = select(func.min(Transaction.date), func.max(Transaction.date)).where(
-                Transaction.ledger_id == ledger_id
-            )
-
-            min_date, max_date = self.session.exec(date_range_query).one()
-
             if min_date and max_date:
                 # Use transaction range if available
                 # For summary and trends, use the full range
@@ -87,26 +97,41 @@ class DashboardService:
                     year -= 1
                 trend_start = date(year, month, 1)
 
-        # Calculate total assets (as of effective_end_date)
-        total_assets = self._calculate_total_assets(ledger_id, effective_end_date)
+        # When every transaction in the trend months lies inside the summary range
+        # (the default all-transactions range, or an explicit range of whole
+        # months), the period summary is the sum of the trend rows and needs no
+        # query of its own.
+        summary_from_trends = not (start_date and end_date) or (
+            summary_start.day == 1 and (effective_end_date + timedelta(days=1)).day == 1
+        )
 
-        # Calculate total liabilities (as of effective_end_date)
-        total_liabilities = self._calculate_total_liabilities(ledger_id, effective_end_date)
+        # Calculate total assets and liabilities (as of effective_end_date)
+        total_assets, total_liabilities = self._calculate_balance_sheet_totals(
+            ledger_id, effective_end_date
+        )
 
-        # Get period summary (income/expenses within range)
-        current_month = self._get_period_summary(ledger_id, summary_start, effective_end_date)
+        # Income/expense totals per month for the trends
+        monthly_totals = self._get_monthly_totals(ledger_id, trend_start, effective_end_date)
 
-        # Get trends
-        trends = self._get_monthly_trends(ledger_id, trend_start, effective_end_date)
+        trends = self._build_monthly_trends(monthly_totals, trend_start, effective_end_date)
+        if summary_from_trends:
+            zero = Decimal("0")
+            current_month = self._format_period_summary(
+                sum((t.get(TransactionType.INCOME, zero) for t in monthly_totals.values()), zero),
+                sum((t.get(TransactionType.EXPENSE, zero) for t in monthly_totals.values()), zero),
+            )
+        else:
+            # Period summary (income/expenses within range)
+            current_month = self._get_period_summary(ledger_id, summary_start, effective_end_date)
 
         return {
-            "total_assets": total_assets,
-            "total_liabilities": total_liabilities,
+            "total_assets": float(total_assets),
+            "total_liabilities": float(total_liabilities),
             "current_month": current_month,
             "trends": trends,
             "date_range": {
-                "start": summary_start.isoformat(),
-                "end": effective_end_date.isoformat(),
+                "start": summary_start,
+                "end": effective_end_date,
             },
         }
 
@@ -119,11 +144,6 @@ class DashboardService:
         Raises:
             ValueError: If ledger doesn't exist
         """
-        # Verify ledger exists
-        ledger = self.session.get(Ledger, ledger_id)
-        if not ledger:
-            raise ValueError(f"Ledger not found: {ledger_id}")
-
         # Define category order
         category_order = [
             AccountType.ASSET,
@@ -132,19 +152,27 @@ class DashboardService:
             AccountType.EXPENSE,
         ]
 
+        # Get all non-archived accounts, sorted by sort_order then name
+        all_accounts = self.session.exec(
+            select(Account)
+            .where(Account.ledger_id == ledger_id)
+            .where(Account.is_archived.is_(False))
+            .order_by(Account.sort_order, Account.name)
+        ).all()
+
+        # Only an empty result needs to tell "new ledger" from "no ledger"
+        if not all_accounts and not self.session.get(Ledger, ledger_id):
+            raise ValueError(f"Ledger not found: {ledger_id}")
+
+        # Current balances are stored on the accounts themselves
+        balances = {account.id: account.current_balance for account in all_accounts}
+
         categories = []
         for account_type in category_order:
-            # Get all non-archived accounts for this type, sorted by sort_order then name
-            accounts = self.session.exec(
-                select(Account)
-                .where(Account.ledger_id == ledger_id)
-                .where(Account.type == account_type)
-                .where(Account.is_archived.is_(False))
-                .order_by(Account.sort_order, Account.name)
-            ).all()
+            accounts = [account for account in all_accounts if account.type == account_type]
 
             # Build tree structure
-            account_tree = self._build_account_tree(accounts)
+            account_tree = self._build_account_tree(accounts, balances)
 
             categories.append(
                 {
@@ -155,44 +183,41 @@ class DashboardService:
 
         return {"categories": categories}
 
-    def _build_account_tree(self, accounts: list[Account]) -> list[dict]:
+    def _build_account_tree(
+        self, accounts: Sequence[Account], balances: dict[uuid.UUID, Decimal]
+    ) -> list[dict]:
         """Build hierarchical tree from flat account list.
 
         Accounts are sorted by sort_order, then name within each level.
+        Balances are looked up from the precomputed balances dict.
+        Accounts whose parent is not in the list become root nodes.
         """
-        # Create lookup dict
-        account_dict = {}
-        for account in accounts:
-            account_dict[account.id] = {
+        # Sort once up front (linear when the query already ordered them); every
+        # children list is then filled in order and needs no per-level sort.
+        ordered = sorted(accounts, key=lambda account: (account.sort_order, account.name))
+
+        account_dict = {
+            account.id: {
                 "id": str(account.id),
                 "name": account.name,
-                "balance": float(self._calculate_account_balance(account)),
+                "balance": float(balances.get(account.id, Decimal("0"))),
                 "parent_id": str(account.parent_id) if account.parent_id else None,
                 "depth": account.depth,
                 "sort_order": account.sort_order,
                 "children": [],
             }
+            for account in ordered
+        }
 
-        # Build tree
         root_accounts = []
-        for account in accounts:
+        for account in ordered:
             node = account_dict[account.id]
-            if account.parent_id and account.parent_id in account_dict:
-                # Add as child
-                account_dict[account.parent_id]["children"].append(node)
+            parent = account_dict.get(account.parent_id) if account.parent_id else None
+            if parent is not None:
+                parent["children"].append(node)
             else:
-                # Root level account
                 root_accounts.append(node)
 
-        # Sort children at each level by sort_order, then name
-        def sort_children(nodes: list[dict]) -> None:
-            nodes.sort(key=lambda x: (x["sort_order"], x["name"]))
-            for node in nodes:
-                if node["children"]:
-                    sort_children(node["children"])
-
-        sort_children(root_accounts)
-
         return root_accounts
 
     def get_account_transactions(
@@ -200,19 +225,30 @@ class DashboardService:
         account_id: uuid.UUID,
         page: int = 1,
         page_size: int = 50,
+        cursor: str | None = None,
     ) -> dict:
         """Get paginated transactions for an account.
 
+        Transactions are ordered by (date, created_at, id), newest first. When
+        cursor is given, the page starts right after that transaction (keyset
+        pagination) and page is ignored; otherwise page is used as an offset.
+
         Args:
             account_id: The account UUID
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), used when no cursor is given
             page_size: Items per page (max 100)
+            cursor: ID of the last transaction of the previous page (next_cursor)
+
+        total_count is exact for page-based requests. Cursor-based requests on a
+        large transactions table (see SIMPLE_PAGINATION_THRESHOLD) skip the
+        COUNT(*) and return total_count=None; use has_more/next_cursor instead.
 
         Returns:
-            dict with account info, transactions, and pagination data
+            dict with account info, transactions, pagination data and next_cursor
+            (IDs and dates as UUID/date objects, serialized by the route)
 
         Raises:
-            ValueError: If account doesn't exist or invalid pagination
+            ValueError: If account doesn't exist, invalid pagination or invalid cursor
         """
         # Validate pagination
         if page < 1:
@@ -225,219 +261,252 @@ class DashboardService:
         if not account:
             raise ValueError(f"Account not found: {account_id}")
 
-        # Count total transactions for this account
-        total_count = self.session.exec(
-            select(func.count(Transaction.id)).where(
-                (Transaction.from_account_id == account_id)
-                | (Transaction.to_account_id == account_id)
-            )
-        ).one()
+        involves_account = (Transaction.from_account_id == account_id) | (
+            Transaction.to_account_id == account_id
+        )
 
-        # Calculate offset
-        offset = (page - 1) * page_size
+        # Count total transactions for this account, unless it is too costly
+        # and the caller pages by cursor (has_more comes from the probe row)
+        total_count: int | None = None
+        if not cursor or self._estimate_transaction_rows() <= SIMPLE_PAGINATION_THRESHOLD:
+            total_count = self.session.scalar(
+                select(func.count(Transaction.id)).where(involves_account)
+            )
 
-        # Get transactions for this page
-        transactions = self.session.exec(
+        # Fetch one extra row to determine has_more
+        statement = (
             select(Transaction)
-            .where(
-                (Transaction.from_account_id == account_id)
-                | (Transaction.to_account_id == account_id)
+            .where(involves_account)
+            .order_by(
+                col(Transaction.date).desc(),
+                col(Transaction.created_at).desc(),
+                col(Transaction.id).desc(),
+            )
+            .limit(page_size + 1)
+        )
+
+        if cursor:
+            cursor_txn = self._get_cursor_transaction(cursor, account_id)
+            statement = statement.where(
+                tuple_(Transaction.date, Transaction.created_at, Transaction.id)
+                < tuple_(cursor_txn.date, cursor_txn.created_at, cursor_txn.id)
+            )
+        else:
+            statement = statement.offset((page - 1) * page_size)
+
+        transactions = list(self.session.exec(statement).all())
+        has_more = len(transactions) > page_size
+        if has_more:
+            transactions = transactions[:page_size]
+
+        # Resolve the other account of every transaction in one IN query
+        other_ids = [
+            txn.to_account_id if txn.from_account_id == account_id else txn.from_account_id
+            for txn in transactions
+        ]
+        other_names: dict[uuid.UUID, str] = {}
+        if other_ids:
+            other_names = dict(
+                self.session.exec(
+                    select(Account.id, Account.name).where(col(Account.id).in_(set(other_ids)))
+                ).all()
             )
-            .order_by(Transaction.date.desc(), Transaction.created_at.desc())
-            .offset(offset)
-            .limit(page_size)
-        ).all()
 
         # Transform transactions with other account name
         transaction_list = []
-        for txn in transactions:
-            # Determine the other account
-            if txn.from_account_id == account_id:
-                other_account = self.session.get(Account, txn.to_account_id)
-            else:
-                other_account = self.session.get(Account, txn.from_account_id)
-
+        for txn, other_id in zip(transactions, other_ids, strict=True):
             transaction_list.append(
                 {
-                    "id": str(txn.id),
-                    "date": txn.date.isoformat(),
+                    "id": txn.id,
+                    "date": txn.date,
                     "description": txn.description,
                     "amount": float(txn.amount),
                     "type": txn.transaction_type.value if txn.transaction_type else "EXPENSE",
-                    "other_account_name": other_account.name if other_account else "Unknown",
+                    "other_account_name": other_names.get(other_id, "Unknown"),
                 }
             )
 
-        has_more = (offset + len(transactions)) < total_count
-
         return {
-            "account_id": str(account_id),
+            "account_id": account_id,
             "account_name": account.name,
             "transactions": transaction_list,
             "total_count": total_count,
             "page": page,
             "page_size": page_size,
             "has_more": has_more,
+            "next_cursor": str(transactions[-1].id) if has_more else None,
         }
 
-    def _calculate_total_assets(self, ledger_id: uuid.UUID, end_date: date) -> Decimal:
-        """Calculate sum of all ASSET account balances as of end_date."""
-        # Get all asset accounts
-        accounts = self.session.exec(
-            select(Account)
-            .where(Account.ledger_id == ledger_id)
-            .where(Account.type == AccountType.ASSET)
-        ).all()
-
-        total = Decimal("0")
-        for account in accounts:
-            total += self._calculate_account_balance(account, end_date)
-
-        return total
-
-    def _calculate_total_liabilities(self, ledger_id: uuid.UUID, end_date: date) -> Decimal:
-        """Calculate sum of all LIABILITY account balances as of end_date."""
-        # Get all liability accounts
-        accounts = self.session.exec(
-            select(Account)
-            .where(Account.ledger_id == ledger_id)
-            .where(Account.type == AccountType.LIABILITY)
-        ).all()
-
-        total = Decimal("0")
-        for account in accounts:
-            total += self._calculate_account_balance(account, end_date)
+    def _estimate_transaction_rows(self) -> int:
+        """Estimate the size of the transactions table from planner statistics.
 
-        return total
+        Only PostgreSQL keeps such an estimate; other databases report 0 so that
+        exact counts are always used. Looked up once per service instance.
+        """
+        if self._transaction_row_estimate is None:
+            estimate = 0
+            if self.session.get_bind().dialect.name == "postgresql":
+                estimate = self.session.scalar(
+                    text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'transactions'")
+                )
+            self._transaction_row_estimate = max(estimate or 0, 0)
+        return self._transaction_row_estimate
 
-    def _calculate_account_balance(self, account: Account, end_date: date | None = None) -> Decimal:
-        """Calculate balance for a single account from transactions.
+    def _get_cursor_transaction(self, cursor: str, account_id: uuid.UUID) -> Transaction:
+        """Resolve a pagination cursor (transaction ID) to its transaction.
 
-        If end_date is provided, only consider transactions on or before that date.
+        Raises:
+            ValueError: If the cursor is malformed, the transaction doesn't exist,
+                or it doesn't involve the account being paged
+        """
+        try:
+            cursor_id = uuid.UUID(cursor)
+        except ValueError:
+            raise ValueError(f"Invalid cursor: {cursor}") from None
+
+        cursor_txn = self.session.get(Transaction, cursor_id)
+        if not cursor_txn or account_id not in (
+            cursor_txn.from_account_id,
+            cursor_txn.to_account_id,
+        ):
+            raise ValueError(f"Invalid cursor: {cursor}")
+        return cursor_txn
+
+    def _calculate_balance_sheet_totals(
+        self, ledger_id: uuid.UUID, end_date: date
+    ) -> tuple[Decimal, Decimal]:
+        """Calculate total ASSET and LIABILITY balances as of end_date in one query.
+
+        Per-account incoming/outgoing sums are joined onto the accounts and the
+        signed balances are summed per account type in the database.
 
-        For Asset: SUM(incoming) - SUM(outgoing)
-        For Liability: SUM(outgoing) - SUM(incoming)
-        For Income: SUM(outgoing)
-        For Expense: SUM(incoming)
+        Returns:
+            (total_assets, total_liabilities)
         """
-        # Build date filter
-        date_filter = []
-        if end_date:
-            date_filter.append(Transaction.date <= end_date)
-
-        # Get incoming sum (to this account)
-        incoming_query = select(func.coalesce(func.sum(Transaction.amount), Decimal("0"))).where(
-            Transaction.to_account_id == account.id
+        incoming = (
+            select(
+                col(Transaction.to_account_id).label("account_id"),
+                func.sum(Transaction.amount).label("total"),
+            )
+            .where(Transaction.ledger_id == ledger_id)
+            .where(Transaction.date <= end_date)
+            .group_by(Transaction.to_account_id)
+            .subquery()
         )
-        for condition in date_filter:
-            incoming_query = incoming_query.where(condition)
-
-        incoming_result = self.session.exec(incoming_query).one()
-        incoming = Decimal(str(incoming_result)) if incoming_result else Decimal("0")
-
-        # Get outgoing sum (from this account)
-        outgoing_query = select(func.coalesce(func.sum(Transaction.amount), Decimal("0"))).where(
-            Transaction.from_account_id == account.id
+        outgoing = (
+            select(
+                col(Transaction.from_account_id).label("account_id"),
+                func.sum(Transaction.amount).label("total"),
+            )
+            .where(Transaction.ledger_id == ledger_id)
+            .where(Transaction.date <= end_date)
+            .group_by(Transaction.from_account_id)
+            .subquery()
+        )
+        incoming_total = func.coalesce(incoming.c.total, 0)
+        outgoing_total = func.coalesce(outgoing.c.total, 0)
+        signed_balance = case(
+            (Account.type == AccountType.ASSET, incoming_total - outgoing_total),
+            else_=outgoing_total - incoming_total,
         )
-        for condition in date_filter:
-            outgoing_query = outgoing_query.where(condition)
-
-        outgoing_result = self.session.exec(outgoing_query).one()
-        outgoing = Decimal(str(outgoing_result)) if outgoing_result else Decimal("0")
 
-        if account.type == AccountType.ASSET:
-            return incoming - outgoing
-        elif account.type == AccountType.LIABILITY:
-            return outgoing - incoming
-        elif account.type == AccountType.INCOME:
-            return outgoing
-        else:  # EXPENSE
-            return incoming
+        totals: dict[AccountType, Decimal] = dict(
+            self.session.exec(
+                select(Account.type, func.sum(signed_balance))
+                .outerjoin(incoming, incoming.c.account_id == Account.id)
+                .outerjoin(outgoing, outgoing.c.account_id == Account.id)
+                .where(Account.ledger_id == ledger_id)
+                .where(col(Account.type).in_([AccountType.ASSET, AccountType.LIABILITY]))
+                .group_by(Account.type)
+            ).all()
+        )
+        zero = Decimal("0")
+        return totals.get(AccountType.ASSET, zero), totals.get(AccountType.LIABILITY, zero)
 
     def _get_period_summary(self, ledger_id: uuid.UUID, start_date: date, end_date: date) -> dict:
         """Get income and expenses for the specified period."""
-        # Sum income transactions
-        income_result = self.session.exec(
-            select(func.coalesce(func.sum(Transaction.amount), Decimal("0")))
-            .where(Transaction.ledger_id == ledger_id)
-            .where(Transaction.transaction_type == TransactionType.INCOME)
-            .where(Transaction.date >= start_date)
-            .where(Transaction.date <= end_date)
-        ).one()
-        income = Decimal(str(income_result)) if income_result else Decimal("0")
-
-        # Sum expense transactions
-        expense_result = self.session.exec(
-            select(func.coalesce(func.sum(Transaction.amount), Decimal("0")))
-            .where(Transaction.ledger_id == ledger_id)
-            .where(Transaction.transaction_type == TransactionType.EXPENSE)
-            .where(Transaction.date >= start_date)
-            .where(Transaction.date <= end_date)
-        ).one()
-        expenses = Decimal(str(expense_result)) if expense_result else Decimal("0")
+        totals: dict[TransactionType, Decimal] = dict(
+            self.session.exec(
+                select(Transaction.transaction_type, func.sum(Transaction.amount))
+                .where(Transaction.ledger_id == ledger_id)
+                .where(
+                    col(Transaction.transaction_type).in_(
+                        [TransactionType.INCOME, TransactionType.EXPENSE]
+                    )
+                )
+                .where(Transaction.date >= start_date)
+                .where(Transaction.date <= end_date)
+                .group_by(Transaction.transaction_type)
+            ).all()
+        )
+        zero = Decimal("0")
+        return self._format_period_summary(
+            totals.get(TransactionType.INCOME, zero), totals.get(TransactionType.EXPENSE, zero)
+        )
 
+    @staticmethod
+    def _format_period_summary(income: Decimal, expenses: Decimal) -> dict:
+        """Format period income and expense totals for the dashboard."""
         return {
             "income": float(income),
             "expenses": float(expenses),
             "net_cash_flow": float(income - expenses),
         }
 
-    def _get_monthly_trends(
+    def _get_monthly_totals(
         self, ledger_id: uuid.UUID, start_date: date, end_date: date
-    ) -> list[dict]:
-        """Get income and expense totals for each month in the range."""
-        trends = []
+    ) -> dict[int, dict[TransactionType, Decimal]]:
+        """Get income and expense totals for each month in the range that has any.
+
+        Totals are read from the pre-aggregated transaction_month_rollups table.
 
-        # Start from the first day of the start_date month
-        current = start_date.replace(day=1)
-        # End at the last day of the end_date month
-        end_limit = (
-            end_date.replace(year=end_date.year + 1, month=1, day=1)
-            if end_date.month == 12
-            else end_date.replace(month=end_date.month + 1, day=1)
-        ) - timedelta(days=1)
-
-        while current <= end_limit:
-            # Range for this month
-            month_start = current
-            if current.month == 12:
-                month_end = current.replace(year=current.year + 1, month=1, day=1) - timedelta(
-                    days=1
+        Returns:
+            dict keyed by month index (year * 12 + month - 1) of totals per type
+        """
+        rollup_month = tuple_(TransactionMonthRollup.year, TransactionMonthRollup.month)
+        rows = self.session.exec(
+            select(
+                TransactionMonthRollup.year,
+                TransactionMonthRollup.month,
+                TransactionMonthRollup.transaction_type,
+                TransactionMonthRollup.total_amount,
+            )
+            .where(TransactionMonthRollup.ledger_id == ledger_id)
+            .where(
+                col(TransactionMonthRollup.transaction_type).in_(
+                    [TransactionType.INCOME, TransactionType.EXPENSE]
                 )
-                next_month = current.replace(year=current.year + 1, month=1, day=1)
-            else:
-                month_end = current.replace(month=current.month + 1, day=1) - timedelta(days=1)
-                next_month = current.replace(month=current.month + 1, day=1)
+            )
+            .where(rollup_month >= tuple_(start_date.year, start_date.month))
+            .where(rollup_month <= tuple_(end_date.year, end_date.month))
+        ).all()
 
-            # Sum income
-            income_result = self.session.exec(
-                select(func.coalesce(func.sum(Transaction.amount), Decimal("0")))
-                .where(Transaction.ledger_id == ledger_id)
-                .where(Transaction.transaction_type == TransactionType.INCOME)
-                .where(Transaction.date >= month_start)
-                .where(Transaction.date <= month_end)
-            ).one()
-            income = Decimal(str(income_result)) if income_result else Decimal("0")
-
-            # Sum expenses
-            expense_result = self.session.exec(
-                select(func.coalesce(func.sum(Transaction.amount), Decimal("0")))
-                .where(Transaction.ledger_id == ledger_id)
-                .where(Transaction.transaction_type == TransactionType.EXPENSE)
-                .where(Transaction.date >= month_start)
-                .where(Transaction.date <= month_end)
-            ).one()
-            expenses = Decimal(str(expense_result)) if expense_result else Decimal("0")
+        totals: dict[int, dict[TransactionType, Decimal]] = {}
+        for year, month, tx_type, amount in rows:
+            totals.setdefault(year * 12 + month - 1, {})[tx_type] = amount
+        return totals
+
+    @staticmethod
+    def _build_monthly_trends(
+        totals: dict[int, dict[TransactionType, Decimal]], start_date: date, end_date: date
+    ) -> list[dict]:
+        """Build one trend entry per month in the range, zero-filling empty months."""
+        # Months as absolute indexes (year * 12 + month - 1), inclusive on both ends
+        first_month = start_date.year * 12 + start_date.month - 1
+        last_month = end_date.year * 12 + end_date.month - 1
 
+        zero = Decimal("0")
+        trends = []
+        for month_index in range(first_month, last_month + 1):
+            year, month = divmod(month_index, 12)
+            month_totals = totals.get(month_index, {})
             trends.append(
                 {
-                    "month": month_start.strftime("%b"),
-                    "year": month_start.year,
-                    "income": float(income),
-                    "expenses": float(expenses),
+                    "month": calendar.month_abbr[month + 1],
+                    "year": year,
+                    "income": float(month_totals.get(TransactionType.INCOME, zero)),
+                    "expenses": float(month_totals.get(TransactionType.EXPENSE, zero)),
                 }
             )
 
-            current = next_month
-
         return trends
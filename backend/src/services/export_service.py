@@ -1,284 +1,307 @@
 import csv
-import io
 import os
-from collections.abc import Generator
+from collections.abc import Generator, Iterable, Iterator
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
-from src.models.account import Account
 from src.models.transaction import Transaction, TransactionType
 from src.schemas.report import BalanceSheet, IncomeStatement, ReportEntry
 
+# Templates live in src/templates. They ship with the code, so the shared
+# environment compiles each one once per process and skips the per-render
+# stat for changes.
+_TEMPLATE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "templates"
+)
+_JINJA_ENV = Environment(
+    loader=FileSystemLoader(_TEMPLATE_DIR),
+    autoescape=select_autoescape(["html", "xml"]),
+    auto_reload=False,
+    cache_size=400,
+)
+
+# BOM (for Excel) and header row of the transaction export. Written directly
+# since none of the header fields need CSV quoting.
+_TRANSACTIONS_CSV_HEADER = (
+    "\ufeff"
+    + ",".join(
+        ["日期", "交易類型", "支出科目", "收入科目", "從科目", "到科目", "金額", "明細", "發票號碼"]
+    )
+    + "\r\n"
+)
+
+# Transaction rows per chunk yielded by the CSV export stream
+CSV_ROWS_PER_CHUNK = 512
+
+# Template output events buffered per chunk of the HTML export stream
+HTML_EVENTS_PER_CHUNK = 50
+
+# CSV type label and the columns that receive the from/to account names,
+# mapped per research.md (2: 支出科目, 3: 收入科目, 4: 從科目, 5: 到科目)
+_CSV_TYPE_COLUMNS: dict[TransactionType, tuple[str, int, int]] = {
+    TransactionType.EXPENSE: ("支出", 4, 2),  # From Asset -> To Expense
+    TransactionType.INCOME: ("收入", 3, 5),  # From Income -> To Asset
+    TransactionType.TRANSFER: ("轉帳", 4, 5),  # From Asset -> To Asset
+}
+
+_HTML_TYPE_LABELS: dict[TransactionType, str] = {
+    TransactionType.EXPENSE: "Expense",
+    TransactionType.INCOME: "Income",
+    TransactionType.TRANSFER: "Transfer",
+}
+
 
 class ExportFormat(str, Enum):
     CSV = "csv"
     HTML = "html"
 
 
+@dataclass(slots=True)
+class _TransactionView:
+    """One row of the HTML transaction report."""
+
+    date: str
+    type_raw: str
+    type_label: str
+    source_label: str
+    target_label: str
+    description: str
+    amount: str
+
+
+class _ListSink:
+    """Write target for csv.writer that collects chunks until drained.
+
+    Cheaper than clearing an io.StringIO after every row: no seek/truncate and
+    no copy of the buffer beyond the final join.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[str] = []
+
+    def write(self, chunk: str) -> int:
+        self._chunks.append(chunk)
+        return len(chunk)
+
+    @property
+    def pending(self) -> int:
+        """Number of writes (csv rows) since the last drain."""
+        return len(self._chunks)
+
+    def drain(self) -> str:
+        """Return everything written since the last drain and reset."""
+        content = "".join(self._chunks)
+        self._chunks.clear()
+        return content
+
+
+def _now_label() -> str:
+    """Current local time as shown in the "Generated at" line of exports."""
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _flatten_entries(entries: list[ReportEntry]) -> list[ReportEntry]:
+    """Return a report tree's entries in display (pre-order) order.
+
+    Walks the tree with an explicit stack, so the CSV rows need no nested
+    generators and the templates can render a plain loop, which is much
+    cheaper in Jinja than a recursive loop over the tree.
+    """
+    flat: list[ReportEntry] = []
+    stack = list(reversed(entries))
+    while stack:
+        entry = stack.pop()
+        flat.append(entry)
+        if entry.children:
+            stack.extend(reversed(entry.children))
+    return flat
+
+
+def _entry_rows(entries: list[ReportEntry]) -> Iterator[list[str]]:
+    """CSV rows for a report section's entries, indented by level."""
+    return (
+        [f"{'  ' * entry.level}{entry.name}", str(entry.amount)]
+        for entry in _flatten_entries(entries)
+    )
+
+
 class ExportService:
     def __init__(self, session: Any):
         self.session = session
-        # Setup Jinja2 env - assume templates folder is relative to this file or project root
-        # Ideally passed in via config, but we'll infer for now: src/templates
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        template_dir = os.path.join(base_dir, "templates")
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(template_dir), autoescape=select_autoescape(["html", "xml"])
-        )
+        self.jinja_env = _JINJA_ENV
+        self._balance_sheet_template = self.jinja_env.get_template("balance_sheet.html")
+        self._income_statement_template = self.jinja_env.get_template("income_statement.html")
+        self._export_report_template = self.jinja_env.get_template("export_report.html")
 
     def generate_balance_sheet_csv(self, report: BalanceSheet) -> Generator[str, None, None]:
         """Generate CSV content for Balance Sheet."""
-        yield "\ufeff"
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Header
-        writer.writerow(["Balance Sheet", f"As of {report.date}"])
-        writer.writerow([])
-        writer.writerow(["Account", "Amount"])
-        yield output.getvalue()
-        output.seek(0)
-        output.truncate(0)
-
-        # Recursive helper
-        def write_entries(entries: list[ReportEntry]):
-            for entry in entries:
-                indent = "  " * entry.level
-                writer.writerow([f"{indent}{entry.name}", str(entry.amount)])
-                yield output.getvalue()
-                output.seek(0)
-                output.truncate(0)
-                if entry.children:
-                    yield from write_entries(entry.children)
-
-        # Assets
-        writer.writerow(["Assets", ""])
-        yield output.getvalue()
-        output.seek(0)
-        output.truncate(0)
-        yield from write_entries(report.assets)
-        writer.writerow(["Total Assets", str(report.total_assets)])
-        yield output.getvalue()
-        output.seek(0)
-        output.truncate(0)
-        writer.writerow([])
-
-        # Liabilities
-        writer.writerow(["Liabilities", ""])
-        yield output.getvalue()
-        output.seek(0)
-        output.truncate(0)
-        yield from write_entries(report.liabilities)
-        writer.writerow(["Total Liabilities", str(report.total_liabilities)])
-        yield output.getvalue()
-        output.seek(0)
-        output.truncate(0)
-        writer.writerow([])
-
-        # Equity
-        writer.writerow(["Equity", ""])
-        yield output.getvalue()
-        output.seek(0)
-        output.truncate(0)
-        yield from write_entries(report.equity)
-        writer.writerow(["Total Equity", str(report.total_equity)])
-        yield output.getvalue()
-        output.seek(0)
-        output.truncate(0)
+
+        def rows() -> Iterator[list[str]]:
+            # Assets
+            yield ["Assets", ""]
+            yield from _entry_rows(report.assets)
+            yield ["Total Assets", str(report.total_assets)]
+            yield []
+
+            # Liabilities
+            yield ["Liabilities", ""]
+            yield from _entry_rows(report.liabilities)
+            yield ["Total Liabilities", str(report.total_liabilities)]
+            yield []
+
+            # Equity
+            yield ["Equity", ""]
+            yield from _entry_rows(report.equity)
+            yield ["Total Equity", str(report.total_equity)]
+
+        # None of the header fields need CSV quoting
+        header = f"\ufeffBalance Sheet,As of {report.date}\r\n\r\nAccount,Amount\r\n"
+        return self._stream_csv(header, rows())
 
     def generate_income_statement_csv(self, report: IncomeStatement) -> Generator[str, None, None]:
         """Generate CSV content for Income Statement."""
-        yield "\ufeff"
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Header
-        writer.writerow(["Income Statement", f"{report.start_date} to {report.end_date}"])
-        writer.writerow([])
-        writer.writerow(["Account", "Amount"])
-        yield output.getvalue()
-        output.seek(0)
-        output.truncate(0)
-
-        # Recursive helper
-        def write_entries(entries: list[ReportEntry]):
-            for entry in entries:
-                indent = "  " * entry.level
-                writer.writerow([f"{indent}{entry.name}", str(entry.amount)])
-                yield output.getvalue()
-                output.seek(0)
-                output.truncate(0)
-                if entry.children:
-                    yield from write_entries(entry.children)
-
-        # Income
-        writer.writerow(["Income", ""])
-        yield output.getvalue()
-        output.seek(0)
-        output.truncate(0)
-        yield from write_entries(report.income)
-        writer.writerow(["Total Income", str(report.total_income)])
-        yield output.getvalue()
-        output.seek(0)
-        output.truncate(0)
-        writer.writerow([])
-
-        # Expenses
-        writer.writerow(["Expenses", ""])
-        yield output.getvalue()
-        output.seek(0)
-        output.truncate(0)
-        yield from write_entries(report.expenses)
-        writer.writerow(["Total Expenses", str(report.total_expenses)])
-        yield output.getvalue()
-        output.seek(0)
-        output.truncate(0)
-        writer.writerow([])
-
-        # Net Income
-        writer.writerow(["Net Income", str(report.net_income)])
-        yield output.getvalue()
-        output.seek(0)
-        output.truncate(0)
+
+        def rows() -> Iterator[list[str]]:
+            # Income
+            yield ["Income", ""]
+            yield from _entry_rows(report.income)
+            yield ["Total Income", str(report.total_income)]
+            yield []
+
+            # Expenses
+            yield ["Expenses", ""]
+            yield from _entry_rows(report.expenses)
+            yield ["Total Expenses", str(report.total_expenses)]
+            yield []
+
+            # Net Income
+            yield ["Net Income", str(report.net_income)]
+
+        # None of the header fields need CSV quoting
+        header = (
+            f"\ufeffIncome Statement,{report.start_date} to {report.end_date}\r\n\r\n"
+            "Account,Amount\r\n"
+        )
+        return self._stream_csv(header, rows())
 
     def generate_balance_sheet_html(self, report: BalanceSheet) -> str:
         """Generate HTML content for Balance Sheet."""
-        template = self.jinja_env.get_template("balance_sheet.html")
+        template = self._balance_sheet_template
         return template.render(
-            report=report, generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            report=report,
+            rows={
+                "assets": _flatten_entries(report.assets),
+                "liabilities": _flatten_entries(report.liabilities),
+                "equity": _flatten_entries(report.equity),
+            },
+            generated_at=_now_label(),
         )
 
     def generate_income_statement_html(self, report: IncomeStatement) -> str:
         """Generate HTML content for Income Statement."""
-        template = self.jinja_env.get_template("income_statement.html")
+        template = self._income_statement_template
         return template.render(
-            report=report, generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            report=report,
+            rows={
+                "income": _flatten_entries(report.income),
+                "expenses": _flatten_entries(report.expenses),
+            },
+            generated_at=_now_label(),
         )
 
     def generate_csv_content(
         self,
         transactions: list[Transaction],
+        rows_per_chunk: int = CSV_ROWS_PER_CHUNK,
     ) -> Generator[str, None, None]:
-        """Generate CSV content from transactions."""
-        # Yield BOM for Excel compatibility
-        yield "\ufeff"
-
-        # CSV Header
-        header = [
-            "日期",
-            "交易類型",
-            "支出科目",
-            "收入科目",
-            "從科目",
-            "到科目",
-            "金額",
-            "明細",
-            "發票號碼",
-        ]
+        """Generate CSV content from transactions.
+
+        Transactions must come with from_account and to_account already
+        loaded; otherwise every row lazy-loads its accounts.
+
+        Yields the BOM and header as the first chunk, then the rows in chunks
+        of up to rows_per_chunk rows.
+        """
+        return self._stream_csv(
+            _TRANSACTIONS_CSV_HEADER,
+            map(self._map_transaction_to_csv_row, transactions),
+            rows_per_chunk,
+        )
+
+    def _stream_csv(
+        self,
+        header: str,
+        rows: Iterable[list[str]],
+        rows_per_chunk: int = CSV_ROWS_PER_CHUNK,
+    ) -> Generator[str, None, None]:
+        """Yield a preformatted header, then rows in chunks of rows_per_chunk rows.
 
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(header)
-        yield output.getvalue()
-        output.seek(0)
-        output.truncate(0)
+        Shared by all CSV exports, so each export only has to describe its rows.
+        """
+        yield header
 
-        for txn in transactions:
-            row = self._map_transaction_to_csv_row(txn)
+        sink = _ListSink()
+        writer = csv.writer(sink)
+        for row in rows:
             writer.writerow(row)
-            yield output.getvalue()
-            output.seek(0)
-            output.truncate(0)
+            if sink.pending >= rows_per_chunk:
+                yield sink.drain()
 
-    def _map_transaction_to_csv_row(self, txn: Transaction) -> list[str]:
-        # Helper to safely get account name
-        def get_account_name(account: Account | None) -> str:
-            return account.name if account else ""
-
-        date_str = txn.date.isoformat()
-        amount_str = str(txn.amount)
-        description = txn.description or ""
-        invoice_no = (
-            ""  # Invoice No not yet in Transaction model, leave empty or assume future field
-        )
+        if sink.pending:
+            yield sink.drain()
 
-        # Initialize columns
-        txn_type = ""
-        expense_acc = ""
-        income_acc = ""
-        from_acc = ""
-        to_acc = ""
-
-        # Map types based on research.md spec
-        # Assuming txn.from_account and txn.to_account are loaded/joined (lazy loading might trigger here)
-        # In a real service we need to ensure these are available.
-        # For this implementation we assume they are accessible properties.
-
-        if txn.transaction_type == TransactionType.EXPENSE:
-            txn_type = "支出"
-            # Expense: From Asset -> To Expense
-            expense_acc = get_account_name(txn.to_account)
-            from_acc = get_account_name(txn.from_account)
-
-        elif txn.transaction_type == TransactionType.INCOME:
-            txn_type = "收入"
-            # Income: From Income -> To Asset
-            income_acc = get_account_name(txn.from_account)
-            to_acc = get_account_name(txn.to_account)
-
-        elif txn.transaction_type == TransactionType.TRANSFER:
-            txn_type = "轉帳"
-            # Transfer: From Asset -> To Asset
-            from_acc = get_account_name(txn.from_account)
-            to_acc = get_account_name(txn.to_account)
-
-        return [
-            date_str,
-            txn_type,
-            expense_acc,
-            income_acc,
-            from_acc,
-            to_acc,
-            amount_str,
-            description,
-            invoice_no,
-        ]
+    def _map_transaction_to_csv_row(self, txn: Transaction) -> list[str]:
+        # Invoice No is not yet in the Transaction model, so its column stays empty
+        row = [txn.date.isoformat(), "", "", "", "", "", str(txn.amount), txn.description or "", ""]
+        columns = _CSV_TYPE_COLUMNS.get(txn.transaction_type)
+        if columns:
+            row[1], from_col, to_col = columns
+            # A missing account leaves its column empty
+            from_account = txn.from_account
+            to_account = txn.to_account
+            if from_account:
+                row[from_col] = from_account.name
+            if to_account:
+                row[to_col] = to_account.name
+        return row
 
     def generate_html_content(
-        self, transactions: list[Transaction], date_range_str: str, account_name: str | None = None
-    ) -> str:
-        """Generate HTML content from transactions."""
-        template = self.jinja_env.get_template("export_report.html")
+        self,
+        transactions: list[Transaction],
+        date_range_str: str,
+        account_name: str | None = None,
+    ) -> Iterator[str]:
+        """Generate HTML content from transactions as a stream of chunks.
+
+        Transactions must come with from_account and to_account already loaded.
+        Row view models are built up front; the template is rendered lazily as
+        the returned stream is consumed.
+        """
+        template = self._export_report_template
 
         # Prepare view models
-        txn_views = []
-        for txn in transactions:
-            type_label = "Unknown"
-            if txn.transaction_type == TransactionType.EXPENSE:
-                type_label = "Expense"
-            elif txn.transaction_type == TransactionType.INCOME:
-                type_label = "Income"
-            elif txn.transaction_type == TransactionType.TRANSFER:
-                type_label = "Transfer"
-
-            txn_views.append(
-                {
-                    "date": txn.date.isoformat(),
-                    "type_raw": txn.transaction_type.value if txn.transaction_type else "EXPENSE",
-                    "type_label": type_label,
-                    "source_label": txn.from_account.name if txn.from_account else "-",
-                    "target_label": txn.to_account.name if txn.to_account else "-",
-                    "description": txn.description or "",
-                    "amount": f"{txn.amount:,.2f}",
-                }
+        txn_views = [
+            _TransactionView(
+                txn.date.isoformat(),
+                txn.transaction_type.value if txn.transaction_type else "EXPENSE",
+                _HTML_TYPE_LABELS.get(txn.transaction_type, "Unknown"),
+                txn.from_account.name if txn.from_account else "-",
+                txn.to_account.name if txn.to_account else "-",
+                txn.description or "",
+                f"{txn.amount:,.2f}",
             )
+            for txn in transactions
+        ]
 
-        return template.render(
+        stream = template.stream(
             date_range=date_range_str,
             account_filter=account_name,
-            generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            generated_at=_now_label(),
             transactions=txn_views,
         )
+        stream.enable_buffering(size=HTML_EVENTS_PER_CHUNK)
+        return stream
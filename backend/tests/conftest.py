@@ -30,6 +30,7 @@ from src.models import (  # noqa: F401
     ImportSession,
     Ledger,
     Transaction,
+    TransactionMonthRollup,
     TransactionTemplate,
     User,
 )
@@ -1,4 +1,15 @@
+import re
+from datetime import date
+from decimal import Decimal
+
 from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session
+
+from src.models.account import Account, AccountType
+from src.models.ledger import Ledger
+from src.models.transaction import Transaction, TransactionType
+from src.models.user import User
 
 
 def test_export_transactions_csv_success(client: TestClient):
@@ -24,3 +35,51 @@ def test_export_transactions_invalid_date_range(client: TestClient):
         "/api/v1/export/transactions?start_date=2024-02-01&end_date=2024-01-01&format=csv"
     )
     assert response.status_code == 422
+
+
+def test_export_transactions_loads_accounts_with_the_transactions(
+    client: TestClient, session: Session
+):
+    user = User(email="export@example.com")
+    session.add(user)
+    session.commit()
+    ledger = Ledger(user_id=user.id, name="Export Ledger")
+    session.add(ledger)
+    session.commit()
+    cash = Account(ledger_id=ledger.id, name="Cash", type=AccountType.ASSET)
+    food = Account(ledger_id=ledger.id, name="Food", type=AccountType.EXPENSE)
+    session.add(cash)
+    session.add(food)
+    session.commit()
+    for day in (1, 2, 3):
+        session.add(
+            Transaction(
+                ledger_id=ledger.id,
+                date=date(2024, 1, day),
+                description=f"Lunch {day}",
+                amount=Decimal("10.00"),
+                from_account_id=cash.id,
+                to_account_id=food.id,
+                transaction_type=TransactionType.EXPENSE,
+            )
+        )
+    session.commit()
+    session.expunge_all()
+
+    statements: list[str] = []
+
+    def record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = client.get("/api/v1/export/transactions?format=csv")
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    assert response.text.count("2024-01-0") == 3
+    assert "Food,,Cash" in response.text
+    # Account names come from the transactions query, not per-row lookups
+    assert not [s for s in statements if re.search(r"FROM accounts\s+WHERE", s)]
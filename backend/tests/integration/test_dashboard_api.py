@@ -0,0 +1,86 @@
+"""Integration tests for the dashboard API routes."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from src.models.account import Account, AccountType
+from src.models.ledger import Ledger
+from src.models.transaction import Transaction, TransactionType
+from src.models.user import User
+
+
+@pytest.fixture
+def ledger_with_salary(session: Session) -> tuple[Ledger, Account, Transaction]:
+    user = User(email="dashboard_api@example.com")
+    session.add(user)
+    session.commit()
+    ledger = Ledger(user_id=user.id, name="Dashboard Ledger")
+    session.add(ledger)
+    session.commit()
+
+    cash = Account(ledger_id=ledger.id, name="Cash", type=AccountType.ASSET)
+    salary = Account(ledger_id=ledger.id, name="Salary", type=AccountType.INCOME)
+    session.add(cash)
+    session.add(salary)
+    session.commit()
+
+    txn = Transaction(
+        ledger_id=ledger.id,
+        date=date(2025, 3, 5),
+        description="March salary",
+        amount=Decimal("1000.00"),
+        from_account_id=salary.id,
+        to_account_id=cash.id,
+        transaction_type=TransactionType.INCOME,
+    )
+    session.add(txn)
+    session.commit()
+    for obj in (ledger, cash, txn):
+        session.refresh(obj)
+    return ledger, cash, txn
+
+
+class TestDashboardApi:
+    def test_dashboard_serializes_numbers_and_dates(
+        self, client: TestClient, ledger_with_salary: tuple[Ledger, Account, Transaction]
+    ):
+        ledger, _, _ = ledger_with_salary
+
+        response = client.get(f"/api/v1/ledgers/{ledger.id}/dashboard")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_assets"] == 1000.0
+        assert data["date_range"] == {"start": "2025-03-05", "end": "2025-03-05"}
+        assert data["trends"] == [{"month": "Mar", "year": 2025, "income": 1000.0, "expenses": 0.0}]
+
+    def test_account_transactions_serializes_ids_and_dates(
+        self, client: TestClient, ledger_with_salary: tuple[Ledger, Account, Transaction]
+    ):
+        _, cash, txn = ledger_with_salary
+
+        response = client.get(f"/api/v1/accounts/{cash.id}/transactions")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["account_id"] == str(cash.id)
+        assert data["transactions"] == [
+            {
+                "id": str(txn.id),
+                "date": "2025-03-05",
+                "description": "March salary",
+                "amount": 1000.0,
+                "type": "INCOME",
+                "other_account_name": "Salary",
+            }
+        ]
+
+    def test_unknown_ledger_returns_404(self, client: TestClient):
+        response = client.get("/api/v1/ledgers/00000000-0000-0000-0000-000000000000/dashboard")
+
+        assert response.status_code == 404
+        assert response.json()["detail"]["error"]["code"] == "LEDGER_NOT_FOUND"
@@ -322,3 +322,57 @@ def test_import_history_pagination(client: TestClient, session, setup_user_and_l
     ids1 = {item["id"] for item in data1["items"]}
     ids2 = {item["id"] for item in data2["items"]}
     assert ids1.isdisjoint(ids2), "Pagination pages should not overlap"
+
+
+def test_import_history_cursor_pagination(client: TestClient, session, setup_user_and_ledger):  # noqa: ARG001
+    """Test import history keyset pagination with next_cursor."""
+    _, ledger = setup_user_and_ledger
+
+    for i in range(3):
+        csv_content = f"""日期,交易類型,支出科目,收入科目,從科目,到科目,金額,明細,發票號碼
+2024/01/{i + 1:02d},支出,E-Food,,A-Cash,,{100 + i},Item{i},
+"""
+        files = {"file": (f"test{i}.csv", csv_content, "text/csv")}
+        preview_resp = client.post(
+            f"/api/v1/ledgers/{ledger.id}/import/preview",
+            files=files,
+            data={"import_type": ImportType.MYAB_CSV.value},
+        )
+        assert preview_resp.status_code == 200
+
+    resp1 = client.get(f"/api/v1/ledgers/{ledger.id}/import/history?limit=2")
+    data1 = resp1.json()
+    assert data1["total"] == 3
+    assert data1["next_cursor"] == data1["items"][-1]["id"]
+
+    resp2 = client.get(
+        f"/api/v1/ledgers/{ledger.id}/import/history?limit=2&cursor={data1['next_cursor']}"
+    )
+    assert resp2.status_code == 200
+    data2 = resp2.json()
+    assert data2["total"] is None
+    assert data2["next_cursor"] is None
+    assert len(data2["items"]) == 1
+    assert data2["items"][0]["id"] not in {item["id"] for item in data1["items"]}
+
+    past_end = client.get(f"/api/v1/ledgers/{ledger.id}/import/history?limit=2&offset=10")
+    assert past_end.json()["items"] == []
+    assert past_end.json()["total"] == 3
+
+    invalid = client.get(
+        f"/api/v1/ledgers/{ledger.id}/import/history?cursor=00000000-0000-0000-0000-000000000000"
+    )
+    assert invalid.status_code == 400
+
+
+def test_import_history_rejects_out_of_range_limit(client: TestClient, setup_user_and_ledger):
+    """Test import history validates its paging parameters."""
+    _, ledger = setup_user_and_ledger
+
+    for query in ("limit=0", "limit=101", "offset=-1"):
+        resp = client.get(f"/api/v1/ledgers/{ledger.id}/import/history?{query}")
+        assert resp.status_code == 422, query
+
+    resp = client.get(f"/api/v1/ledgers/{ledger.id}/import/history?limit=1")
+    assert resp.status_code == 200
+    assert resp.json()["next_cursor"] is None
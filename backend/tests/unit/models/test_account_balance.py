@@ -0,0 +1,155 @@
+"""Unit tests for the Account.current_balance maintenance hooks.
+
+current_balance must always equal the balance summed from the account's own
+transactions, across inserts, updates (including expired instances) and deletes,
+and loaded accounts must not keep a stale value after a flush.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session, select
+
+from src.models.account import Account, AccountType
+from src.models.ledger import Ledger
+from src.models.transaction import Transaction, TransactionType
+from src.models.user import User
+
+
+@pytest.fixture
+def ledger(session: Session) -> Ledger:
+    user = User(email="balance@example.com")
+    session.add(user)
+    session.commit()
+    ledger = Ledger(user_id=user.id, name="Balance Ledger")
+    session.add(ledger)
+    session.commit()
+    session.refresh(ledger)
+    return ledger
+
+
+@pytest.fixture
+def accounts(session: Session, ledger: Ledger) -> dict[str, Account]:
+    accounts = {
+        "cash": Account(ledger_id=ledger.id, name="Cash", type=AccountType.ASSET),
+        "card": Account(ledger_id=ledger.id, name="Card", type=AccountType.LIABILITY),
+        "salary": Account(ledger_id=ledger.id, name="Salary", type=AccountType.INCOME),
+        "food": Account(ledger_id=ledger.id, name="Food", type=AccountType.EXPENSE),
+    }
+    for account in accounts.values():
+        session.add(account)
+    session.commit()
+    for account in accounts.values():
+        session.refresh(account)
+    return accounts
+
+
+def _txn(ledger: Ledger, from_account: Account, to_account: Account, amount: str) -> Transaction:
+    return Transaction(
+        ledger_id=ledger.id,
+        date=date(2025, 3, 1),
+        description="Test",
+        amount=Decimal(amount),
+        from_account_id=from_account.id,
+        to_account_id=to_account.id,
+        transaction_type=TransactionType.EXPENSE,
+    )
+
+
+def _balances(session: Session, accounts: dict[str, Account]) -> dict[str, Decimal]:
+    for account in accounts.values():
+        session.refresh(account)
+    return {key: account.current_balance for key, account in accounts.items()}
+
+
+class TestAccountCurrentBalance:
+    def test_insert_applies_signed_amounts(
+        self, session: Session, ledger: Ledger, accounts: dict[str, Account]
+    ):
+        session.add(_txn(ledger, accounts["salary"], accounts["cash"], "1000.00"))
+        session.add(_txn(ledger, accounts["cash"], accounts["food"], "150.00"))
+        session.add(_txn(ledger, accounts["card"], accounts["food"], "40.00"))
+        session.commit()
+
+        assert _balances(session, accounts) == {
+            "cash": Decimal("850.00"),
+            "card": Decimal("40.00"),
+            "salary": Decimal("1000.00"),
+            "food": Decimal("190.00"),
+        }
+
+    def test_update_after_commit_moves_amount(
+        self, session: Session, ledger: Ledger, accounts: dict[str, Account]
+    ):
+        txn = _txn(ledger, accounts["cash"], accounts["food"], "150.00")
+        session.add(txn)
+        session.commit()  # expires txn, so old values must be reloaded on assignment
+
+        txn.from_account_id = accounts["card"].id
+        txn.amount = Decimal("60.00")
+        session.add(txn)
+        session.commit()
+
+        assert _balances(session, accounts) == {
+            "cash": Decimal("0.00"),
+            "card": Decimal("60.00"),
+            "salary": Decimal("0.00"),
+            "food": Decimal("60.00"),
+        }
+
+    def test_delete_reverses_amount(
+        self, session: Session, ledger: Ledger, accounts: dict[str, Account]
+    ):
+        keep = _txn(ledger, accounts["cash"], accounts["food"], "100.00")
+        drop = _txn(ledger, accounts["cash"], accounts["food"], "40.00")
+        session.add(keep)
+        session.add(drop)
+        session.commit()
+
+        session.delete(drop)
+        session.commit()
+
+        balances = _balances(session, accounts)
+        assert balances["cash"] == Decimal("-100.00")
+        assert balances["food"] == Decimal("100.00")
+
+    def test_flush_expires_loaded_balances(
+        self, session: Session, ledger: Ledger, accounts: dict[str, Account]
+    ):
+        assert accounts["cash"].current_balance == Decimal("0.00")
+
+        session.add(_txn(ledger, accounts["salary"], accounts["cash"], "1000.00"))
+        session.flush()
+
+        # Same session, no refresh: both the loaded instance and a fresh query
+        # must see the balance written by the flush
+        assert accounts["cash"].current_balance == Decimal("1000.00")
+        cash = session.exec(select(Account).where(Account.id == accounts["cash"].id)).one()
+        assert cash is accounts["cash"]
+        assert cash.current_balance == Decimal("1000.00")
+
+    def test_flush_batches_balance_updates(
+        self, session: Session, ledger: Ledger, accounts: dict[str, Account]
+    ):
+        statements: list[tuple[str, bool]] = []
+
+        def record(_conn, _cursor, statement, _params, _context, executemany):
+            if statement.lstrip().upper().startswith("UPDATE ACCOUNTS"):
+                statements.append((statement, executemany))
+
+        engine = session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            for amount in ("10.00", "20.00", "30.00"):
+                session.add(_txn(ledger, accounts["cash"], accounts["food"], amount))
+            session.commit()
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert len(statements) == 1
+        assert statements[0][1] is True
+        balances = _balances(session, accounts)
+        assert balances["cash"] == Decimal("-60.00")
+        assert balances["food"] == Decimal("60.00")
@@ -0,0 +1,148 @@
+"""Unit tests for TransactionMonthRollup maintenance hooks.
+
+The rollup must always equal the per-month sum of transactions, across
+inserts, updates (including updates of expired instances) and deletes.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session, select
+
+from src.models.account import Account, AccountType
+from src.models.ledger import Ledger
+from src.models.transaction import Transaction, TransactionType
+from src.models.transaction_month_rollup import TransactionMonthRollup
+from src.models.user import User
+
+
+@pytest.fixture
+def ledger(session: Session) -> Ledger:
+    user = User(email="rollup@example.com")
+    session.add(user)
+    session.commit()
+    ledger = Ledger(user_id=user.id, name="Rollup Ledger")
+    session.add(ledger)
+    session.commit()
+    session.refresh(ledger)
+    return ledger
+
+
+@pytest.fixture
+def cash_and_food(session: Session, ledger: Ledger) -> tuple[Account, Account]:
+    cash = Account(ledger_id=ledger.id, name="Cash", type=AccountType.ASSET)
+    food = Account(ledger_id=ledger.id, name="Food", type=AccountType.EXPENSE)
+    session.add(cash)
+    session.add(food)
+    session.commit()
+    session.refresh(cash)
+    session.refresh(food)
+    return cash, food
+
+
+def _rollups(session: Session, ledger: Ledger) -> dict[tuple[int, int, str], Decimal]:
+    rows = session.exec(
+        select(TransactionMonthRollup).where(TransactionMonthRollup.ledger_id == ledger.id)
+    ).all()
+    return {
+        (r.year, r.month, r.transaction_type.value): r.total_amount
+        for r in rows
+        if r.total_amount != 0
+    }
+
+
+def _expense(ledger: Ledger, cash: Account, food: Account, day: date, amount: str) -> Transaction:
+    return Transaction(
+        ledger_id=ledger.id,
+        date=day,
+        description="Lunch",
+        amount=Decimal(amount),
+        from_account_id=cash.id,
+        to_account_id=food.id,
+        transaction_type=TransactionType.EXPENSE,
+    )
+
+
+class TestTransactionMonthRollup:
+    def test_insert_accumulates_per_month(self, session: Session, ledger: Ledger, cash_and_food):
+        cash, food = cash_and_food
+        session.add(_expense(ledger, cash, food, date(2025, 3, 1), "100.00"))
+        session.add(_expense(ledger, cash, food, date(2025, 3, 31), "50.50"))
+        session.add(_expense(ledger, cash, food, date(2025, 4, 2), "20.00"))
+        session.commit()
+
+        assert _rollups(session, ledger) == {
+            (2025, 3, "EXPENSE"): Decimal("150.50"),
+            (2025, 4, "EXPENSE"): Decimal("20.00"),
+        }
+
+    def test_update_after_commit_moves_amount(
+        self, session: Session, ledger: Ledger, cash_and_food
+    ):
+        cash, food = cash_and_food
+        txn = _expense(ledger, cash, food, date(2025, 3, 10), "100.00")
+        session.add(txn)
+        session.commit()  # expires txn, so old values must be reloaded on assignment
+
+        txn.date = date(2025, 5, 1)
+        txn.amount = Decimal("80.00")
+        txn.transaction_type = TransactionType.INCOME
+        session.add(txn)
+        session.commit()
+
+        assert _rollups(session, ledger) == {(2025, 5, "INCOME"): Decimal("80.00")}
+
+    def test_update_of_other_fields_leaves_rollup(
+        self, session: Session, ledger: Ledger, cash_and_food
+    ):
+        cash, food = cash_and_food
+        txn = _expense(ledger, cash, food, date(2025, 3, 10), "100.00")
+        session.add(txn)
+        session.commit()
+
+        txn.description = "Dinner"
+        session.add(txn)
+        session.commit()
+
+        assert _rollups(session, ledger) == {(2025, 3, "EXPENSE"): Decimal("100.00")}
+
+    def test_delete_subtracts_amount(self, session: Session, ledger: Ledger, cash_and_food):
+        cash, food = cash_and_food
+        keep = _expense(ledger, cash, food, date(2025, 3, 10), "100.00")
+        drop = _expense(ledger, cash, food, date(2025, 3, 11), "40.00")
+        session.add(keep)
+        session.add(drop)
+        session.commit()
+
+        session.delete(drop)
+        session.commit()
+
+        assert _rollups(session, ledger) == {(2025, 3, "EXPENSE"): Decimal("100.00")}
+
+    def test_flush_upserts_in_one_batch(self, session: Session, ledger: Ledger, cash_and_food):
+        cash, food = cash_and_food
+        session.add(_expense(ledger, cash, food, date(2025, 3, 1), "100.00"))
+        session.commit()
+
+        statements: list[bool] = []
+
+        def record(_conn, _cursor, statement, _params, _context, executemany):
+            if "transaction_month_rollups" in statement and statement.lstrip().startswith("INSERT"):
+                statements.append(executemany)
+
+        engine = session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            for day in (date(2025, 3, 2), date(2025, 3, 3), date(2025, 4, 1)):
+                session.add(_expense(ledger, cash, food, day, "10.00"))
+            session.commit()
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert statements == [True]
+        assert _rollups(session, ledger) == {
+            (2025, 3, "EXPENSE"): Decimal("120.00"),
+            (2025, 4, "EXPENSE"): Decimal("10.00"),
+        }
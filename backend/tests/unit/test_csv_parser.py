@@ -32,6 +32,12 @@ class TestCsvParserUtils:
         content_big5 = "測試".encode("big5")
         assert CsvParser.detect_encoding(BytesIO(content_big5)) == "big5"
 
+    def test_read_csv_strips_utf8_bom(self):
+        content = "\ufeff日期,金額\n2024/01/01,100\n".encode()
+        for encoding in ("utf-8", "utf_8", None):
+            rows = CsvParser.read_csv(BytesIO(content), encoding=encoding)
+            assert rows == [{"日期": "2024/01/01", "金額": "100"}]
+
 
 class TestMyAbCsvParser:
     def test_parse_valid_csv(self, myab_csv_file):
@@ -62,6 +68,20 @@ class TestMyAbCsvParser:
         assert tx3.date == datetime.date(2024, 1, 3)
         assert tx3.amount == Decimal("5000.50")
 
+    def test_parse_english_transaction_types(self):
+        content = """日期,交易類型,支出科目,收入科目,從科目,到科目,金額,明細,發票號碼
+2024/01/01,Expense,E-Food,,A-Cash,,100,Lunch,
+2024/01/02,INCOME,,I-Salary,,A-Bank,200,Pay,
+2024/01/03,transfer,,,A-Bank,L-Card,300,Bill,
+2024/01/04,Refund,,,A-Bank,L-Card,400,Oops,""".encode()
+        parser = MyAbCsvParser()
+        transactions, errors = parser.parse(BytesIO(content))
+        assert [tx.transaction_type for tx in transactions] == ["EXPENSE", "INCOME", "TRANSFER"]
+        assert transactions[1].from_account_name == "I-Salary"
+        assert transactions[1].to_account_name == "A-Bank"
+        assert len(errors) == 1
+        assert "Unknown transaction type" in errors[0].message
+
     def test_parse_invalid_date(self):
         content = """日期,交易類型,支出科目,收入科目,從科目,到科目,金額,明細,發票號碼
 invalid_date,支出,E-Food,,,A-Cash,100,Desc,""".encode()
@@ -182,6 +202,17 @@ class TestCreditCardCsvParser:
         assert "ＣＵＢＥＡｐｐ轉帳繳款" not in descriptions
         assert "上期帳單總額" not in descriptions
 
+    def test_ctbc_skips_blank_and_dateless_rows(self):
+        """Blank lines and summary rows without a date are not reported as errors."""
+        from src.services.csv_parser import CreditCardCsvParser
+
+        content = "交易日,商店,消費金額\n2024-01-10,台北101美食街,280\n,,\n,本期合計,280\n".encode()
+
+        parser = CreditCardCsvParser("CTBC")
+        transactions, errors = parser.parse(BytesIO(content))
+        assert errors == []
+        assert len(transactions) == 1
+
     def test_cathay_year_inference_cross_year(self):
         """Transaction month > bill month must resolve to previous year."""
         from src.services.csv_parser import CreditCardCsvParser
@@ -192,6 +223,17 @@ class TestCreditCardCsvParser:
         assert cross_year_tx.date.year == 2025
         assert cross_year_tx.date.month == 12
 
+    def test_cathay_without_header_marker_falls_back_to_skip_rows(self):
+        """Without the header marker, the static skip_rows setting is used."""
+        from src.services.csv_parser import CreditCardCsvParser
+
+        content = '"日期","說明","金額"\n"01/15","星巴克信義店","150"\n'.encode()
+
+        parser = CreditCardCsvParser("CATHAY")
+        transactions, errors = parser.parse(BytesIO(content))
+        assert len(errors) == 0
+        assert [tx.description for tx in transactions] == ["星巴克信義店"]
+
     def test_parse_ctbc_csv(self):
         from src.services.csv_parser import CreditCardCsvParser
 
@@ -225,3 +267,57 @@ class TestCreditCardCsvParser:
         parser = CreditCardCsvParser("CATHAY")
         transactions, errors = parser.parse(BytesIO(invalid_csv))
         assert len(errors) > 0
+
+
+SAMPLE_CATHAY_STATEMENT_CSV = """交易日期,摘要,支出,存入,餘額
+2024/01/05,全聯福利中心,520,,10000
+2024/01/10,薪資轉入,,50000,60000
+2024/01/12,,,,60000
+""".encode()
+
+
+class TestBankStatementCsvParser:
+    def test_parse_cathay_statement(self):
+        from src.schemas.data_import import AccountType, TransactionType
+        from src.services.csv_parser import BankStatementCsvParser
+
+        parser = BankStatementCsvParser("CATHAY")
+        transactions, errors = parser.parse(BytesIO(SAMPLE_CATHAY_STATEMENT_CSV))
+        assert len(errors) == 0
+        assert len(transactions) == 2
+
+        expense, income = transactions
+        assert expense.transaction_type == TransactionType.EXPENSE
+        assert expense.amount == Decimal("520")
+        assert expense.from_account_name == "國泰世華.活期存款"
+        assert expense.from_account_path.path_segments == ["國泰世華", "活期存款"]
+        assert expense.to_account_path.account_type == AccountType.EXPENSE
+
+        assert income.transaction_type == TransactionType.INCOME
+        assert income.amount == Decimal("50000")
+        assert income.to_account_path.account_type == AccountType.ASSET
+        assert income.from_account_path.path_segments == ["其他收入"]
+
+    def test_parse_amount_strips_currency_symbols(self):
+        from src.services.csv_parser import BankStatementCsvParser
+
+        parser = BankStatementCsvParser("CATHAY")
+        assert parser._parse_amount(" NT$1,234.50 ") == Decimal("1234.50")
+        assert parser._parse_amount("-$2,000") == Decimal("-2000")
+        assert parser._parse_amount("") is None
+        assert parser._parse_amount("abc") is None
+
+    @pytest.mark.parametrize("separator", ["\x85", " "])
+    def test_unicode_line_separator_stays_in_cell(self, separator):
+        from src.services.csv_parser import BankStatementCsvParser
+
+        content = f"""交易日期,摘要,支出,存入,餘額
+2024/01/05,全聯{separator}福利中心,520,,10000
+""".encode()
+
+        parser = BankStatementCsvParser("CATHAY")
+        transactions, errors = parser.parse(BytesIO(content))
+        assert errors == []
+        assert len(transactions) == 1
+        assert transactions[0].description == f"全聯{separator}福利中心"
+        assert transactions[0].amount == Decimal("520")
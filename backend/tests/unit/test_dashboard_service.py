@@ -14,7 +14,7 @@ from src.models.account import Account, AccountType
 from src.models.ledger import Ledger
 from src.models.transaction import Transaction, TransactionType
 from src.models.user import User
-from src.services.dashboard_service import DashboardService
+from src.services.dashboard_service import SIMPLE_PAGINATION_THRESHOLD, DashboardService
 
 
 @pytest.fixture
@@ -130,6 +130,38 @@ class TestGetDashboardSummary:
         # Cash should have 5000 (incoming)
         assert result["total_assets"] == Decimal("5000.00")
 
+    def test_calculates_total_liabilities(
+        self, session: Session, ledger: Ledger, accounts: dict[str, Account]
+    ):
+        """Total liabilities should be outgoing minus incoming for LIABILITY accounts."""
+        charge = Transaction(
+            ledger_id=ledger.id,
+            date=date.today(),
+            description="Card purchase",
+            amount=Decimal("800.00"),
+            from_account_id=accounts["credit_card"].id,
+            to_account_id=accounts["food"].id,
+            transaction_type=TransactionType.EXPENSE,
+        )
+        payment = Transaction(
+            ledger_id=ledger.id,
+            date=date.today(),
+            description="Card payment",
+            amount=Decimal("300.00"),
+            from_account_id=accounts["bank"].id,
+            to_account_id=accounts["credit_card"].id,
+            transaction_type=TransactionType.TRANSFER,
+        )
+        session.add(charge)
+        session.add(payment)
+        session.commit()
+
+        service = DashboardService(session)
+        result = service.get_dashboard_summary(ledger.id)
+
+        assert result["total_liabilities"] == Decimal("500.00")
+        assert result["total_assets"] == Decimal("-300.00")
+
     def test_calculates_current_month_income_expenses(
         self, session: Session, ledger: Ledger, accounts: dict[str, Account]
     ):
@@ -245,6 +277,60 @@ class TestGetDashboardSummary:
         assert result["trends"][2]["year"] == today.year
         assert result["trends"][2]["month"] == today.strftime("%b")
 
+    def test_trends_bucket_amounts_by_month(
+        self, session: Session, ledger: Ledger, accounts: dict[str, Account]
+    ):
+        """Each trend bar should only include its own month's income and expenses."""
+        txns = [
+            (date(2024, 11, 5), "INCOME", "salary", "cash", "1000.00"),
+            (date(2024, 11, 20), "EXPENSE", "cash", "food", "150.00"),
+            (date(2025, 1, 10), "EXPENSE", "cash", "food", "80.00"),
+            (date(2025, 1, 12), "TRANSFER", "cash", "bank", "500.00"),
+        ]
+        for txn_date, txn_type, from_key, to_key, amount in txns:
+            session.add(
+                Transaction(
+                    ledger_id=ledger.id,
+                    date=txn_date,
+                    description=f"{txn_type} {txn_date}",
+                    amount=Decimal(amount),
+                    from_account_id=accounts[from_key].id,
+                    to_account_id=accounts[to_key].id,
+                    transaction_type=TransactionType(txn_type),
+                )
+            )
+        session.commit()
+
+        service = DashboardService(session)
+        result = service.get_dashboard_summary(
+            ledger.id, start_date=date(2024, 11, 1), end_date=date(2025, 1, 31)
+        )
+
+        trends = [(t["year"], t["month"], t["income"], t["expenses"]) for t in result["trends"]]
+        assert trends == [
+            (2024, "Nov", 1000.0, 150.0),
+            (2024, "Dec", 0.0, 0.0),
+            (2025, "Jan", 0.0, 80.0),
+        ]
+        # Whole-month range: the period summary is derived from the same rows
+        assert result["current_month"] == {
+            "income": 1000.0,
+            "expenses": 230.0,
+            "net_cash_flow": 770.0,
+        }
+
+    def test_keeps_callers_pending_changes(
+        self, session: Session, ledger: Ledger, accounts: dict[str, Account]
+    ):
+        """Uncommitted work on the caller's session must survive the summary."""
+        pending = Account(ledger_id=ledger.id, name="Pending", type=AccountType.ASSET)
+        session.add(pending)
+
+        DashboardService(session).get_dashboard_summary(ledger.id)
+
+        assert session.in_transaction()
+        assert session.get(Account, pending.id) is pending
+
 
 class TestGetAccountsByCategory:
     """Tests for get_accounts_by_category method."""
@@ -260,6 +346,13 @@ class TestGetAccountsByCategory:
         assert result["categories"][2]["type"] == "INCOME"
         assert result["categories"][3]["type"] == "EXPENSE"
 
+    def test_raises_error_for_nonexistent_ledger(self, session: Session):
+        """Should raise ValueError for non-existent ledger."""
+        service = DashboardService(session)
+
+        with pytest.raises(ValueError, match="Ledger not found"):
+            service.get_accounts_by_category(uuid.uuid4())
+
     def test_groups_accounts_by_type(
         self, session: Session, ledger: Ledger, accounts: dict[str, Account]
     ):
@@ -300,6 +393,33 @@ class TestGetAccountsByCategory:
         cash_account = next(a for a in asset_category["accounts"] if a["name"] == "Cash")
         assert cash_account["balance"] == 1000.0
 
+    def test_nests_children_sorted_by_sort_order_then_name(
+        self, session: Session, ledger: Ledger, accounts: dict[str, Account]
+    ):
+        """Children should be nested under their parent and sorted at each level."""
+        food = accounts["food"]
+        for name, sort_order in [("Snacks", 1), ("Dinner", 0), ("Breakfast", 1)]:
+            session.add(
+                Account(
+                    ledger_id=ledger.id,
+                    name=name,
+                    type=AccountType.EXPENSE,
+                    parent_id=food.id,
+                    depth=2,
+                    sort_order=sort_order,
+                )
+            )
+        session.commit()
+
+        service = DashboardService(session)
+        result = service.get_accounts_by_category(ledger.id)
+
+        expense_category = next(c for c in result["categories"] if c["type"] == "EXPENSE")
+        assert [a["name"] for a in expense_category["accounts"]] == ["Food"]
+        children = expense_category["accounts"][0]["children"]
+        assert [c["name"] for c in children] == ["Dinner", "Breakfast", "Snacks"]
+        assert all(c["parent_id"] == str(food.id) for c in children)
+
 
 class TestGetAccountTransactions:
     """Tests for get_account_transactions method."""
@@ -372,6 +492,106 @@ class TestGetAccountTransactions:
         assert len(result["transactions"]) == 5
         assert result["has_more"] is False
 
+    def test_paginates_with_cursor(
+        self, session: Session, ledger: Ledger, accounts: dict[str, Account]
+    ):
+        """Following next_cursor should walk every transaction exactly once."""
+        # Several transactions share a date so the keyset needs its tie-breakers
+        for i in range(7):
+            session.add(
+                Transaction(
+                    ledger_id=ledger.id,
+                    date=date.today() - timedelta(days=i // 3),
+                    description=f"Transaction {i}",
+                    amount=Decimal("10.00"),
+                    from_account_id=accounts["cash"].id,
+                    to_account_id=accounts["food"].id,
+                    transaction_type=TransactionType.EXPENSE,
+                )
+            )
+        session.commit()
+
+        service = DashboardService(session)
+        expected = [
+            t["id"]
+            for t in service.get_account_transactions(accounts["cash"].id, page_size=100)[
+                "transactions"
+            ]
+        ]
+
+        seen: list[str] = []
+        cursor = None
+        while True:
+            result = service.get_account_transactions(
+                accounts["cash"].id, page_size=3, cursor=cursor
+            )
+            seen.extend(t["id"] for t in result["transactions"])
+            cursor = result["next_cursor"]
+            if not result["has_more"]:
+                assert cursor is None
+                break
+
+        assert seen == expected
+        assert len(seen) == 7
+
+    def test_cursor_pages_skip_count_for_large_tables(
+        self, session: Session, ledger: Ledger, accounts: dict[str, Account], monkeypatch
+    ):
+        """Cursor requests should skip COUNT(*) once the table is estimated large."""
+        for i in range(3):
+            session.add(
+                Transaction(
+                    ledger_id=ledger.id,
+                    date=date.today() - timedelta(days=i),
+                    description=f"Transaction {i}",
+                    amount=Decimal("10.00"),
+                    from_account_id=accounts["cash"].id,
+                    to_account_id=accounts["food"].id,
+                    transaction_type=TransactionType.EXPENSE,
+                )
+            )
+        session.commit()
+
+        service = DashboardService(session)
+        monkeypatch.setattr(
+            service, "_estimate_transaction_rows", lambda: SIMPLE_PAGINATION_THRESHOLD + 1
+        )
+
+        first = service.get_account_transactions(accounts["cash"].id, page_size=2)
+        assert first["total_count"] == 3  # page-based requests keep the exact count
+
+        second = service.get_account_transactions(
+            accounts["cash"].id, page_size=2, cursor=first["next_cursor"]
+        )
+        assert second["total_count"] is None
+        assert len(second["transactions"]) == 1
+        assert second["has_more"] is False
+
+    def test_raises_error_for_invalid_cursor(
+        self, session: Session, ledger: Ledger, accounts: dict[str, Account]
+    ):
+        """Should raise ValueError for a malformed, unknown or foreign cursor."""
+        # A transaction that doesn't involve cash can't position a cash page
+        other = Transaction(
+            ledger_id=ledger.id,
+            date=date.today(),
+            description="Groceries",
+            amount=Decimal("30.00"),
+            from_account_id=accounts["bank"].id,
+            to_account_id=accounts["food"].id,
+            transaction_type=TransactionType.EXPENSE,
+        )
+        session.add(other)
+        session.commit()
+        service = DashboardService(session)
+
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            service.get_account_transactions(accounts["cash"].id, cursor="not-a-uuid")
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            service.get_account_transactions(accounts["cash"].id, cursor=str(uuid.uuid4()))
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            service.get_account_transactions(accounts["cash"].id, cursor=str(other.id))
+
     def test_raises_error_for_nonexistent_account(self, session: Session):
         """Should raise ValueError for non-existent account."""
         service = DashboardService(session)
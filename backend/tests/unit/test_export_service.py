@@ -1,3 +1,4 @@
+import re
 from datetime import date
 from decimal import Decimal
 from unittest.mock import Mock
@@ -7,6 +8,7 @@ import pytest
 
 from src.models.account import Account
 from src.models.transaction import Transaction, TransactionType
+from src.schemas.report import BalanceSheet, IncomeStatement, ReportEntry
 from src.services.export_service import ExportService
 
 
@@ -85,10 +87,10 @@ def test_generate_csv_content_success(export_service, sample_transactions):
     content = list(generator)
 
     # Check BOM
-    assert content[0] == "\ufeff"
+    assert content[0].startswith("\ufeff")
 
     # Check Header
-    full_csv = "".join(content[1:])  # Skip BOM
+    full_csv = "".join(content)[1:]  # Skip BOM
     lines = full_csv.strip().split("\r\n")
     # Python csv writer uses \r\n by default on many platforms or just \n depending on config, let's split safely
     if len(lines) == 1:  # Maybe just \n
@@ -110,9 +112,17 @@ def test_generate_csv_content_success(export_service, sample_transactions):
     assert "2024-01-10,轉帳,,,Cash,Bank,200.00,Deposit," in lines[3]
 
 
+def test_generate_csv_content_batches_rows(export_service, sample_transactions):
+    content = list(export_service.generate_csv_content(sample_transactions, rows_per_chunk=2))
+
+    # BOM and header, then rows in chunks of at most two
+    assert content[0].startswith("\ufeff日期,")
+    assert [chunk.count("\r\n") for chunk in content] == [1, 2, 1]
+
+
 def test_generate_html_content_success(export_service, sample_transactions):
-    html_content = export_service.generate_html_content(
-        sample_transactions, "2024-01-01 to 2024-01-31"
+    html_content = "".join(
+        export_service.generate_html_content(sample_transactions, "2024-01-01 to 2024-01-31")
     )
 
     # Check basic structure
@@ -135,3 +145,89 @@ def test_generate_html_content_success(export_service, sample_transactions):
     # T3: Transfer 200.00
     assert "200.00" in html_content
     assert "Deposit" in html_content
+
+
+def _entry(name: str, amount: str, level: int, children=()) -> ReportEntry:
+    return ReportEntry(name=name, amount=Decimal(amount), level=level, children=list(children))
+
+
+def test_generate_balance_sheet_csv(export_service):
+    report = BalanceSheet(
+        date=date(2024, 12, 31),
+        assets=[
+            _entry(
+                "Assets",
+                "1500.00",
+                0,
+                [
+                    _entry("Cash", "500.00", 1),
+                    _entry("Bank", "1000.00", 1, [_entry("Savings", "1000.00", 2)]),
+                ],
+            )
+        ],
+        liabilities=[_entry("Card", "200.00", 0)],
+        equity=[],
+        total_assets=Decimal("1500.00"),
+        total_liabilities=Decimal("200.00"),
+        total_equity=Decimal("1300.00"),
+    )
+
+    content = "".join(export_service.generate_balance_sheet_csv(report))
+
+    assert content == (
+        "\ufeffBalance Sheet,As of 2024-12-31\r\n\r\nAccount,Amount\r\n"
+        "Assets,\r\nAssets,1500.00\r\n  Cash,500.00\r\n  Bank,1000.00\r\n"
+        "    Savings,1000.00\r\nTotal Assets,1500.00\r\n\r\n"
+        "Liabilities,\r\nCard,200.00\r\nTotal Liabilities,200.00\r\n\r\n"
+        "Equity,\r\nTotal Equity,1300.00\r\n"
+    )
+
+
+def test_generate_income_statement_csv(export_service):
+    report = IncomeStatement(
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 12, 31),
+        income=[_entry("Salary", "5000.00", 0)],
+        expenses=[_entry("Food", "300.00", 0, [_entry("Lunch", "300.00", 1)])],
+        total_income=Decimal("5000.00"),
+        total_expenses=Decimal("300.00"),
+        net_income=Decimal("4700.00"),
+    )
+
+    content = "".join(export_service.generate_income_statement_csv(report))
+
+    assert content == (
+        "\ufeffIncome Statement,2024-01-01 to 2024-12-31\r\n\r\nAccount,Amount\r\n"
+        "Income,\r\nSalary,5000.00\r\nTotal Income,5000.00\r\n\r\n"
+        "Expenses,\r\nFood,300.00\r\n  Lunch,300.00\r\nTotal Expenses,300.00\r\n\r\n"
+        "Net Income,4700.00\r\n"
+    )
+
+
+def test_generate_balance_sheet_html_renders_nested_entries_in_order(export_service, monkeypatch):
+    monkeypatch.setattr("src.services.export_service._now_label", lambda: "2025-01-01 09:00:00")
+    report = BalanceSheet(
+        date=date(2024, 12, 31),
+        assets=[
+            _entry(
+                "Assets",
+                "1500.00",
+                0,
+                [
+                    _entry("Cash", "500.00", 1),
+                    _entry("Bank", "1000.00", 1, [_entry("Savings", "1000.00", 2)]),
+                ],
+            )
+        ],
+        liabilities=[],
+        equity=[],
+        total_assets=Decimal("1500.00"),
+        total_liabilities=Decimal("0.00"),
+        total_equity=Decimal("1500.00"),
+    )
+
+    html_content = export_service.generate_balance_sheet_html(report)
+
+    names = re.findall(r'<td class="indent-(\d)">([^<]+)</td>', html_content)
+    assert names == [("0", "Assets"), ("1", "Cash"), ("1", "Bank"), ("2", "Savings")]
+    assert "Generated at: 2025-01-01 09:00:00" in html_content
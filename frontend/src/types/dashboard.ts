@@ -133,6 +133,7 @@ export interface AccountTransactionsResponse {
   page: number
   page_size: number
   has_more: boolean
+  next_cursor: string | null
 }
 
 /**